@@ -0,0 +1,48 @@
+import argparse
+import sys
+from src.benchmarks import SUITES, run_suite, compare, save_results, load_results
+from src.equivalence import run_checks
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the simulation, inference and GA hot paths")
+    parser.add_argument('--suite', action='append', choices=sorted(SUITES),
+                        help="Suite to run (repeatable, default all)")
+    parser.add_argument('--repeat', type=int, default=5, help="Timed runs per benchmark")
+    parser.add_argument('--min-time', type=float, default=0.05, help="Minimum seconds per timed run")
+    parser.add_argument('--output', default='benchmark_results.json', help="Where to save the results")
+    parser.add_argument('--baseline', default=None, help="Earlier results file to compare against")
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help="Allowed relative slowdown before a benchmark counts as a regression")
+    parser.add_argument('--check', action='store_true',
+                        help="Before timing, check the batched simulation paths reproduce the sprite engine "
+                             "exactly; exits nonzero on a mismatch")
+    parser.add_argument('--check-only', action='store_true', help="Run the checks and skip the benchmarks")
+    args = parser.parse_args()
+
+    if args.check or args.check_only:
+        passed = run_checks(progress=lambda name, ok, detail:
+                            print(f"{'ok' if ok else 'MISMATCH':8s} {name:30s} {detail}"))
+        if not passed:
+            sys.exit(1)
+        if args.check_only:
+            return
+
+    def report(name, result):
+        print(f"{name:50s} {result['median_s'] * 1e6:12.1f} us")
+
+    results = run_suite(args.suite, args.repeat, args.min_time, progress=report)
+    save_results(args.output, results)
+    print(f"Saved results to {args.output}")
+
+    if args.baseline:
+        regressions = compare(results, load_results(args.baseline), args.tolerance)
+        for name, before, after, ratio in regressions:
+            print(f"REGRESSION {name}: {before * 1e6:.1f} us -> {after * 1e6:.1f} us ({ratio:.2f}x)")
+        if regressions:
+            sys.exit(1)
+        print("No regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import argparse
+import os
+from src.genetic_algorithm import GeneticAlgorithm
+from src.checkpoint import load_checkpoint
+from src.policy_export import POLICY_FORMATS, TABLE_BINS, compile_policy, save_policy, accuracy_report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compile the best network of a checkpoint into fast inference forms")
+    parser.add_argument('checkpoint', help="Checkpoint .npz written by train.py or main.py")
+    parser.add_argument('--format', action='append', choices=POLICY_FORMATS,
+                        help="Form to export (repeatable, default all)")
+    parser.add_argument('--output', default='policy', help="Output prefix, one <prefix>_<format>.npz per form")
+    parser.add_argument('--bins', type=int, nargs=5, default=TABLE_BINS, metavar='N',
+                        help="Lookup table bins for bird y, velocity, pipe x, gap top and gap bottom")
+    parser.add_argument('--courses', type=int, default=32, help="Courses flown for the accuracy report")
+    parser.add_argument('--seed', type=int, default=0, help="First course seed of the accuracy report")
+    args = parser.parse_args()
+
+    ga = GeneticAlgorithm()
+    population = load_checkpoint(args.checkpoint, ga)
+    network = ga.best_brain if ga.best_brain is not None else population[0]
+
+    policies = {}
+    for policy_format in args.format or POLICY_FORMATS:
+        policy = compile_policy(network, policy_format, args.bins)
+        path = f"{args.output}_{policy_format}.npz"
+        save_policy(path, policy)
+        print(f"Saved {policy_format} policy to {path} ({os.path.getsize(path)} bytes)")
+        if policy_format != 'float64':
+            policies[policy_format] = policy
+
+    report = accuracy_report(network, policies, range(args.seed, args.seed + args.courses))
+    print(f"{'Format':>8} | {'Agree (play)':>12} | {'Agree (grid)':>12} | {'Fitness':>9} | {'Delta':>8} | "
+          f"{'Bytes':>7} | {'us/predict':>10}")
+    for name, row in report.items():
+        print(f"{name:>8} | {row['trajectory_agreement']:>12.2%} | {row['uniform_agreement']:>12.2%} | "
+              f"{row['fitness']:>9.1f} | {row['fitness_delta']:>+8.1f} | {row['bytes']:>7} | "
+              f"{row['predict_us']:>10.2f}")
@@ -1,5 +1,27 @@
+import argparse
 from src.game import Game
+from src.profiler import PROFILER
 
 if __name__ == "__main__":
-    game = Game()
+    parser = argparse.ArgumentParser(description="Flappy Bird AI")
+    parser.add_argument('--resume', default=None, help="Continue AI training from a checkpoint file")
+    parser.add_argument('--checkpoint', default=None, help="Save AI training progress to this .npz file")
+    parser.add_argument('--checkpoint-every', type=int, default=10, help="Generations between checkpoints")
+    parser.add_argument('--course-seed', type=int, default=None,
+                        help="Play every game on the same pipe course instead of a new one each time")
+    parser.add_argument('--policy', default=None,
+                        help="Fly a policy exported by export_policy.py in autonomous mode instead of training")
+    parser.add_argument('--profile', action='store_true', help="Time each phase and show the breakdown in AI mode")
+    parser.add_argument('--profile-output', default=None, help="Write per-generation timings to this .csv or .json file")
+    parser.add_argument('--cprofile', default=None, help="Run cProfile and dump its stats to this file")
+    args = parser.parse_args()
+
+    if args.profile or args.profile_output:
+        PROFILER.enable()
+    if args.cprofile:
+        PROFILER.start_cprofile()
+
+    game = Game(resume=args.resume, checkpoint=args.checkpoint, checkpoint_every=args.checkpoint_every,
+                profile_output=args.profile_output, cprofile_output=args.cprofile,
+                course_seed=args.course_seed, policy=args.policy)
     game.run()
@@ -0,0 +1,52 @@
+import argparse
+import sys
+from src.replay import load_replays, verify_replay
+
+
+def list_replays(replays):
+    print(f"{'#':>4} | {'Gen':>5} | {'Fitness':>9} | {'Frames':>6} | {'Course':>10} | Genome")
+    for index, replay in enumerate(replays):
+        genome = replay.genome_id[:12] if replay.genome_id else '-'
+        stored = '' if replay.genome is None else ' (stored)'
+        print(f"{index:>4} | {replay.generation:>5} | {replay.fitness:>9.1f} | {len(replay):>6} | "
+              f"{replay.course_seed:>10} | {genome}{stored}")
+
+
+def verify_replays(replays, tolerance):
+    """Check every replay against the simulation paths, returns True if all match"""
+    ok = True
+    for index, replay in enumerate(replays):
+        results = verify_replay(replay, tolerance)
+        for path, (fitness, frames, matches) in results.items():
+            frames = '-' if frames is None else frames
+            status = 'ok' if matches else 'MISMATCH'
+            print(f"#{index:<3} {path:<13} fitness {fitness:>9.3f} (recorded {replay.fitness:.3f}) "
+                  f"frames {frames:>6} {status}")
+            ok = ok and matches
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="List, verify and watch Flappy Bird AI replays")
+    parser.add_argument('path', help="Replay file written by train.py --record")
+    parser.add_argument('--verify', action='store_true',
+                        help="Re-simulate every replay and check it reaches the recorded fitness")
+    parser.add_argument('--tolerance', type=float, default=1e-9,
+                        help="Allowed fitness difference for the VecEnv check")
+    parser.add_argument('--play', type=int, default=None, metavar='INDEX', help="Watch one replay in the game window")
+    args = parser.parse_args()
+
+    replays = load_replays(args.path)
+    list_replays(replays)
+
+    if args.verify and not verify_replays(replays, args.tolerance):
+        sys.exit(1)
+
+    if args.play is not None:
+        from src.game import Game
+
+        game = Game(replay=replays[args.play])
+        game.game_mode = 'auto'
+        game.state = 'GAME'
+        game.reset_game()
+        game.run()
@@ -0,0 +1,27 @@
+import argparse
+import multiprocessing
+from src.snapshot import SnapshotRing
+from src.spectator import Spectator, run_trainer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Watch headless training run at full speed in another process")
+    parser.add_argument('--population', type=int, default=50, help="Birds per generation")
+    parser.add_argument('--seed', type=int, default=None, help="Random seed for reproducible runs")
+    parser.add_argument('--show', type=int, default=100, help="Maximum number of birds drawn")
+    args = parser.parse_args()
+
+    ring = SnapshotRing(max_birds=min(args.show, args.population))
+    trainer = multiprocessing.Process(target=run_trainer, args=(ring.name, args.population, args.seed),
+                                      daemon=True)
+    trainer.start()
+    try:
+        Spectator(ring).run(trainer)
+    finally:
+        ring.request_stop()
+        trainer.join()
+        ring.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+import itertools
+import json
+import os
+import platform
+import random
+import time
+import numpy as np
+
+# The update_ai_mode benchmark needs a Game, which opens a window
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+from src.settings import *
+from src.neural_network import NeuralNetwork
+from src.genetic_algorithm import GeneticAlgorithm
+from src.selection import SELECTION_METHODS, select_indices
+from src.bird import Bird
+from src.pipe import PipeManager
+from src.headless import HeadlessGame
+from src.multi_course import simulate_courses
+from src.vec_env import VecEnv
+from src.policy_export import OBSERVATION_RANGES, compile_policy
+
+POPULATION_SIZES = [50, 500, 5000]
+
+
+def measure(func, repeat=5, min_time=0.05):
+    """
+    Time a function the way timeit does
+
+    The number of calls per run is grown until one run takes at least
+    min_time, then the run is repeated.
+
+    Args:
+        func: Function without arguments
+        repeat: Number of timed runs
+        min_time: Minimum duration of a single run in seconds
+
+    Returns:
+        dict: Per-call timings in seconds (median, min, mean) and call counts
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1 << 20:
+            break
+        number *= 2
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        timings.append((time.perf_counter() - start) / number)
+
+    return {
+        'median_s': float(np.median(timings)),
+        'min_s': min(timings),
+        'mean_s': sum(timings) / len(timings),
+        'number': number,
+        'repeat': repeat,
+    }
+
+
+def _seed(seed=0):
+    random.seed(seed)
+    np.random.seed(seed)
+
+
+def bench_neural_network():
+    _seed()
+    nn = NeuralNetwork()
+    other = NeuralNetwork()
+    inputs = np.array([[0.5, 0.5, 0.5, 0.3, 0.6]])
+    return {
+        'nn.forward': lambda: nn.forward(inputs),
+        'nn.predict': lambda: nn.predict(256, 1.5, 120, 180, 330),
+        'nn.crossover': lambda: nn.crossover(other),
+        'nn.mutate': lambda: nn.copy().mutate(),
+    }
+
+
+def _evolve_first_generation(ga, population, fitness):
+    """Evolve from the GA's initial state, so repeats neither grow history nor drift"""
+    ga.generation = 1
+    ga.best_fitness = 0
+    ga.best_brain = None
+    ga.history.clear()
+    return ga.evolve(population, fitness)
+
+
+def bench_genetic_algorithm():
+    benches = {}
+    for size in POPULATION_SIZES:
+        _seed()
+        ga = GeneticAlgorithm(population_size=size)
+        population = ga.create_population()
+        fitness = list(np.random.random(size) * 100)
+        benches[f'ga.select_parents[{size}]'] = lambda ga=ga, p=population, f=fitness: ga.select_parents(p, f)
+        for method in SELECTION_METHODS:
+            benches[f'selection.select_indices[{size},{method}]'] = \
+                lambda f=fitness, n=2 * size, m=method: select_indices(f, n, m)
+        benches[f'ga.evolve[{size}]'] = lambda ga=ga, p=population, f=fitness: _evolve_first_generation(ga, p, f)
+    return benches
+
+
+def bench_bird_think():
+    _seed()
+    pipes = PipeManager(headless=True)
+    pipes.spawn(SCREEN_HEIGHT // 2)
+    bird = Bird(brain=NeuralNetwork(), headless=True)
+    return {'bird.think': lambda: bird.think(pipes)}
+
+
+def bench_policy():
+    _seed()
+    network = NeuralNetwork()
+    pipes = PipeManager(headless=True)
+    pipes.spawn(SCREEN_HEIGHT // 2)
+    low, high = np.array(OBSERVATION_RANGES, dtype=np.float64).T
+    observations = np.random.default_rng(0).uniform(low, high, (500, 5))
+    benches = {}
+    for policy_format in ('int8', 'float16', 'table'):
+        policy = compile_policy(network, policy_format)
+        bird = Bird(brain=policy, headless=True)
+        benches[f'policy.predict[{policy_format}]'] = lambda policy=policy: policy.predict(256, 1.5, 120, 180, 330)
+        benches[f'policy.predict_batch[{policy_format},500]'] = \
+            lambda policy=policy: policy.predict_batch(observations)
+        benches[f'bird.think[{policy_format}]'] = lambda bird=bird: bird.think(pipes)
+    return benches
+
+
+def bench_game_frame():
+    from src.game import Game
+
+    _seed()
+    game = Game()
+    game.game_mode = 'auto'
+    game.state = 'GAME'
+    game.reset_game()
+    # Keep the same generation running instead of timing evolve as well
+    game.evolve_population = lambda: None
+
+    def frame():
+        game.update_game()
+        if not any(bird.alive for bird in game.ai_birds):
+            game.reset_game()
+
+    return {'game.update_ai_mode_frame': frame}
+
+
+def bench_headless_generation(sizes=POPULATION_SIZES, sprite_limit=500):
+    benches = {}
+    for size in sizes:
+        for vectorized in (False, True):
+            if not vectorized and size > sprite_limit:
+                continue
+            _seed()
+            trainer = HeadlessGame(population_size=size, seed=0, vectorized=vectorized)
+            trainer.ai_brains = trainer.ga.create_population()
+            name = f"headless.generation[{size},{'vectorized' if vectorized else 'sprites'}]"
+            benches[name] = lambda trainer=trainer: trainer.simulate(course_seed=0)
+        # One batched pass over several courses
+        _seed()
+        population = GeneticAlgorithm(population_size=size).create_population()
+        benches[f'headless.courses[{size},x4]'] = \
+            lambda population=population: simulate_courses(population, (0, 1, 2, 3))
+    return benches
+
+
+def bench_vec_env(sizes=POPULATION_SIZES):
+    benches = {}
+    for size in sizes:
+        env = VecEnv(size, seed=0)
+        env.reset()
+        actions = np.random.default_rng(0).random((64, size)) < 0.05
+        counter = itertools.count()
+        benches[f'vec_env.step[{size}]'] = \
+            lambda env=env, actions=actions, counter=counter: env.step(actions[next(counter) % 64])
+    return benches
+
+
+SUITES = {
+    'neural_network': bench_neural_network,
+    'genetic_algorithm': bench_genetic_algorithm,
+    'bird': bench_bird_think,
+    'policy': bench_policy,
+    'game': bench_game_frame,
+    'headless': bench_headless_generation,
+    'vec_env': bench_vec_env,
+}
+
+
+def run_suite(names=None, repeat=5, min_time=0.05, progress=None):
+    """
+    Run benchmarks and collect results
+
+    Args:
+        names: Suite names from SUITES to run (default all)
+        repeat: Timed runs per benchmark
+        min_time: Minimum duration of a single run in seconds
+        progress: Optional function called with (name, result) after each benchmark
+
+    Returns:
+        dict: Metadata and per-benchmark results, ready for json.dump
+    """
+    results = {}
+    for suite in names or SUITES:
+        for name, func in SUITES[suite]().items():
+            results[name] = measure(func, repeat, min_time)
+            if progress:
+                progress(name, results[name])
+
+    return {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'pygame': pygame.version.ver,
+            'machine': platform.machine(),
+            'processor': platform.processor(),
+        },
+        'results': results,
+    }
+
+
+def compare(results, baseline, tolerance=0.2):
+    """
+    Flag benchmarks that got slower than a stored baseline
+
+    Args:
+        results: Output of run_suite
+        baseline: Earlier output of run_suite
+        tolerance: Allowed relative slowdown of the median (0.2 = 20%)
+
+    Returns:
+        list: (name, baseline median, current median, ratio) for every regression
+    """
+    regressions = []
+    for name, result in results['results'].items():
+        previous = baseline['results'].get(name)
+        if previous is None:
+            continue
+        ratio = result['median_s'] / previous['median_s']
+        if ratio > 1 + tolerance:
+            regressions.append((name, previous['median_s'], result['median_s'], ratio))
+    return regressions
+
+
+def save_results(path, results):
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2)
+
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)
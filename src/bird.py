@@ -1,24 +1,74 @@
 import pygame
 from src.settings import *
 from src.neural_network import NeuralNetwork
+from src.observation import gap_features
+from src.policy_export import load_policy
+
+BIRD_FRAMES = ['bluebird-upflap.png', 'bluebird-midflap.png', 'bluebird-downflap.png']
+
+# Velocity only ever moves in GRAVITY steps from BIRD_JUMP up to the clamp,
+# so the set of tilt angles is small and finite
+ROTATION_STEPS = int(round((BIRD_MAX_VELOCITY - BIRD_JUMP) / GRAVITY)) + 1
+
+
+def rotation_index(velocity):
+    """Index of the atlas entry for a velocity"""
+    index = int(round((velocity - BIRD_JUMP) / GRAVITY))
+    return min(max(index, 0), ROTATION_STEPS - 1)
+
+
+def build_rotation_atlas(images):
+    """
+    Pre-rotate every flap frame for every reachable velocity
+    
+    Args:
+        images: List of flap frame surfaces
+    
+    Returns:
+        list: atlas[frame][rotation_index(velocity)] -> rotated surface
+    """
+    return [[pygame.transform.rotate(image, (BIRD_JUMP + step * GRAVITY) * -2)
+             for step in range(ROTATION_STEPS)]
+            for image in images]
+
 
 class Bird(pygame.sprite.Sprite):
-    def __init__(self, brain=None):
+    def __init__(self, brain=None, headless=None):
+        """
+        Args:
+            brain: Optional policy deciding the jumps - a NeuralNetwork, a compiled
+                QuantizedNetwork or LookupTablePolicy, or the path of an exported policy file
+            headless: Skip images (defaults to ASSETS.headless)
+        """
         super().__init__()
+        if headless is None:
+            headless = ASSETS.headless
         self.images = []
         self.index = 0
         self.counter = 0
+        self.headless = headless
         
         # AI components
+        if isinstance(brain, str):
+            brain = load_policy(brain)
         self.brain = brain if brain else None
         self.fitness = 0
         self.alive = True
+        self.velocity = 0
+        self.clicked = False
+        
+        if headless:
+            # Physics only - no surfaces, just the collision rect
+            self.image = None
+            self.rect = pygame.Rect((0, 0), BIRD_SIZE)
+            self.rect.center = BIRD_START_POS
+            return
         
         # Load images or create fallbacks
-        for img_name in ['bluebird-upflap.png', 'bluebird-midflap.png', 'bluebird-downflap.png']:
-            img = load_image(img_name)
+        for img_name in BIRD_FRAMES:
+            img = ASSETS.get(img_name, scale2x=True) # Usually flappy bird assets are small
             if img:
-                self.images.append(pygame.transform.scale2x(img)) # Usually flappy bird assets are small
+                self.images.append(img)
             else:
                 # Fallback
                 surf = pygame.Surface((34, 24))
@@ -27,23 +77,30 @@ class Bird(pygame.sprite.Sprite):
 
         self.image = self.images[self.index]
         self.rect = self.image.get_rect(center=BIRD_START_POS)
-        self.velocity = 0
-        self.clicked = False
+        
+        # Shared between all birds when the sprites come from the registry
+        if all(ASSETS.get(name, scale2x=True) for name in BIRD_FRAMES):
+            self.rotations = ASSETS.get_derived(('bird-rotations',) + tuple(BIRD_FRAMES),
+                                                lambda: build_rotation_atlas(self.images))
+        else:
+            self.rotations = build_rotation_atlas(self.images)
 
     def update(self, flying=True):
         if flying:
             # Gravity
             self.velocity += GRAVITY
-            if self.velocity > 8:
-                self.velocity = 8
+            if self.velocity > BIRD_MAX_VELOCITY:
+                self.velocity = BIRD_MAX_VELOCITY
             
             self.rect.y += int(self.velocity)
 
-        # Animation
+        if self.headless:
+            return
+
+        # Animation (counted in simulated frames)
         self.counter += 1
-        flap_cooldown = 5
 
-        if self.counter > flap_cooldown:
+        if self.counter > BIRD_FLAP_FRAMES:
             self.counter = 0
             self.index += 1
             if self.index >= len(self.images):
@@ -51,7 +108,7 @@ class Bird(pygame.sprite.Sprite):
             self.image = self.images[self.index]
 
         # Rotation
-        self.image = pygame.transform.rotate(self.images[self.index], self.velocity * -2)
+        self.image = self.rotations[self.index][rotation_index(self.velocity)]
 
     def jump(self):
         self.velocity = BIRD_JUMP
@@ -64,10 +121,12 @@ class Bird(pygame.sprite.Sprite):
     
     def think(self, pipes):
         """
-        Use neural network to decide whether to jump
+        Use the brain to decide whether to jump
+
+        Any brain form works: they all take the raw inputs of NeuralNetwork.predict.
         
         Args:
-            pipes: Sprite group of pipes
+            pipes: PipeManager holding the active pipe pairs
         
         Returns:
             bool: True if decided to jump
@@ -75,44 +134,7 @@ class Bird(pygame.sprite.Sprite):
         if not self.brain or not self.alive:
             return False
         
-        # Find the next pipe
-        next_pipe = None
-        min_distance = float('inf')
-        
-        for pipe in pipes:
-            # Only consider pipes ahead of the bird
-            if pipe.rect.right > self.rect.left:
-                distance = pipe.rect.left - self.rect.left
-                if distance < min_distance:
-                    min_distance = distance
-                    next_pipe = pipe
-        
-        if next_pipe is None:
-            # No pipe ahead, use default values
-            pipe_x = 288
-            pipe_top_y = 0
-            pipe_bottom_y = 512
-        else:
-            pipe_x = min_distance
-            # Determine if this is top or bottom pipe
-            if next_pipe.rect.bottom < 256:  # Top pipe
-                pipe_top_y = next_pipe.rect.bottom
-                # Find corresponding bottom pipe
-                for pipe in pipes:
-                    if pipe.rect.left == next_pipe.rect.left and pipe.rect.top > 256:
-                        pipe_bottom_y = pipe.rect.top
-                        break
-                else:
-                    pipe_bottom_y = pipe_top_y + PIPE_GAP
-            else:  # Bottom pipe
-                pipe_bottom_y = next_pipe.rect.top
-                # Find corresponding top pipe
-                for pipe in pipes:
-                    if pipe.rect.left == next_pipe.rect.left and pipe.rect.bottom < 256:
-                        pipe_top_y = pipe.rect.bottom
-                        break
-                else:
-                    pipe_top_y = pipe_bottom_y - PIPE_GAP
+        pipe_x, pipe_top_y, pipe_bottom_y = gap_features(pipes.bounds(), self.rect.left)
         
         # Make decision
         should_jump = self.brain.predict(
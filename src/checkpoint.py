@@ -0,0 +1,183 @@
+import os
+import queue
+import random
+import threading
+import numpy as np
+from src.neural_network import NeuralNetwork, population_matrix, networks_from_matrix
+
+HISTORY_FIELDS = ['generation', 'avg_fitness', 'max_fitness', 'min_fitness', 'best_ever']
+
+
+def _python_rng_arrays(prefix, state):
+    """Flatten a random.getstate() tuple into arrays"""
+    version, internal, gauss_next = state
+    return {
+        f'{prefix}_version': np.array(version),
+        f'{prefix}_internal': np.array(internal, dtype=np.uint64),
+        f'{prefix}_gauss': np.array(np.nan if gauss_next is None else gauss_next),
+    }
+
+
+def _python_rng_state(data, prefix):
+    """Rebuild a random.getstate() tuple from checkpoint arrays"""
+    gauss = float(data[f'{prefix}_gauss'])
+    return (int(data[f'{prefix}_version']),
+            tuple(int(x) for x in data[f'{prefix}_internal']),
+            None if np.isnan(gauss) else gauss)
+
+
+def capture_state(ga, population, course_rng=None):
+    """
+    Snapshot everything needed to resume training
+
+    Only copies arrays, so it is cheap enough to call between generations;
+    the expensive compression and disk write happen in save_state.
+
+    Args:
+        ga: GeneticAlgorithm instance
+        population: List of NeuralNetwork instances for the next generation
+        course_rng: Optional random.Random drawing course seeds
+
+    Returns:
+        dict: Arrays ready for np.savez_compressed
+    """
+    first = population[0]
+    np_state = np.random.get_state()
+    state = {
+        'population': population_matrix(population),
+        'layer_sizes': np.array([first.input_size, first.hidden_size, first.output_size]),
+        'population_size': np.array(ga.population_size),
+        'mutation_rate': np.array(ga.mutation_rate),
+        'mutation_strength': np.array(ga.mutation_strength),
+        'crossover_method': np.array(ga.crossover_method),
+        'crossover_rate': np.array(ga.crossover_rate),
+        'selection_method': np.array(ga.selection_method),
+        'tournament_size': np.array(ga.tournament_size),
+        'generation': np.array(ga.generation),
+        'best_fitness': np.array(ga.best_fitness, dtype=np.float64),
+        'best_brain': ga.best_brain.params.copy() if ga.best_brain else np.empty(0),
+        'history': np.array([[stats[field] for field in HISTORY_FIELDS] for stats in ga.history],
+                            dtype=np.float64).reshape(-1, len(HISTORY_FIELDS)),
+        'numpy_rng_keys': np_state[1].copy(),
+        'numpy_rng_pos': np.array(np_state[2]),
+        'numpy_rng_has_gauss': np.array(np_state[3]),
+        'numpy_rng_gauss': np.array(np_state[4]),
+    }
+    state.update(_python_rng_arrays('python_rng', random.getstate()))
+    if course_rng is not None:
+        state.update(_python_rng_arrays('course_rng', course_rng.getstate()))
+    return state
+
+
+def save_state(path, state):
+    """
+    Write a captured state to disk atomically
+
+    Args:
+        path: Destination .npz file
+        state: dict from capture_state
+    """
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        np.savez_compressed(f, **state)
+    os.replace(tmp_path, path)
+
+
+def save_checkpoint(path, ga, population, course_rng=None):
+    """Capture and write a checkpoint synchronously"""
+    save_state(path, capture_state(ga, population, course_rng))
+
+
+def load_checkpoint(path, ga, course_rng=None):
+    """
+    Restore a checkpoint into a GeneticAlgorithm and the global RNGs
+
+    Args:
+        path: .npz file written by save_checkpoint or CheckpointWriter
+        ga: GeneticAlgorithm instance to restore into
+        course_rng: Optional random.Random to restore the course seed stream into
+
+    Returns:
+        list: Population of NeuralNetwork instances to evaluate next
+    """
+    with np.load(path) as data:
+        sizes = [int(x) for x in data['layer_sizes']]
+        ga.population_size = int(data['population_size'])
+        ga.mutation_rate = float(data['mutation_rate'])
+        ga.mutation_strength = float(data['mutation_strength'])
+        ga.crossover_method = str(data['crossover_method'])
+        ga.crossover_rate = float(data['crossover_rate'])
+        if 'selection_method' in data:
+            ga.selection_method = str(data['selection_method'])
+            ga.tournament_size = int(data['tournament_size'])
+        ga.generation = int(data['generation'])
+        ga.best_fitness = float(data['best_fitness'])
+        best = data['best_brain']
+        ga.best_brain = NeuralNetwork(*sizes, params=best.copy()) if best.size else None
+        ga.history = [
+            dict(zip(HISTORY_FIELDS, (int(row[0]),) + tuple(float(x) for x in row[1:])))
+            for row in data['history']
+        ]
+
+        np.random.set_state(('MT19937', data['numpy_rng_keys'], int(data['numpy_rng_pos']),
+                             int(data['numpy_rng_has_gauss']), float(data['numpy_rng_gauss'])))
+        random.setstate(_python_rng_state(data, 'python_rng'))
+        if course_rng is not None and 'course_rng_internal' in data:
+            course_rng.setstate(_python_rng_state(data, 'course_rng'))
+
+        return networks_from_matrix(data['population'].copy(), *sizes)
+
+
+class CheckpointWriter:
+    """Writes checkpoints every N generations on a background thread"""
+
+    def __init__(self, path, every=10):
+        """
+        Initialize writer
+
+        Args:
+            path: Destination .npz file, overwritten with the latest checkpoint
+            every: Generations between checkpoints
+        """
+        self.path = path
+        self.every = max(1, every)
+        self.saved_generation = 0
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        while True:
+            state = self.queue.get()
+            if state is None:
+                break
+            save_state(self.path, state)
+
+    def maybe_save(self, ga, population, course_rng=None):
+        """
+        Queue a checkpoint if this generation is due
+
+        Call after evolve, with the population that will be evaluated next.
+        """
+        completed = ga.generation - 1
+        if completed > 0 and completed % self.every == 0:
+            self.save(ga, population, course_rng)
+
+    def save(self, ga, population, course_rng=None):
+        """Queue a checkpoint of the current state unless this generation is already saved"""
+        completed = ga.generation - 1
+        if completed > 0 and completed != self.saved_generation:
+            self.queue.put(capture_state(ga, population, course_rng))
+            self.saved_generation = completed
+
+    def close(self, ga=None, population=None, course_rng=None):
+        """
+        Flush pending checkpoints and stop the writer thread
+
+        Given the training state, the final generations since the last
+        periodic checkpoint are saved first.
+        """
+        if ga is not None:
+            self.save(ga, population, course_rng)
+        self.queue.put(None)
+        self.thread.join()
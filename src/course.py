@@ -0,0 +1,94 @@
+import random
+import numpy as np
+from src.settings import *
+
+def course_length(max_frames=GENERATION_TIMEOUT_FRAMES):
+    """
+    Pipe pairs an episode of max_frames frames needs
+
+    Pairs spawn on frames 0, F, 2F, ... up to the last frame, and spawn_due
+    also reads the spawn frame of the pair after that one.
+    """
+    return max_frames // PIPE_FREQUENCY_FRAMES + 2
+
+
+COURSE_LENGTH = course_length()
+
+
+def _gap_offset(rng):
+    """Height of the next gap centre relative to the middle of the screen"""
+    return rng.randint(-100, 100)
+
+
+class Course:
+    """Pipe course of one episode, precomputed from a seed
+
+    Gap heights and spawn frames live in two arrays, so every bird of a
+    generation - whether stepped as sprites, as arrays or in worker
+    processes - meets exactly the same pipes.  Episodes that outlast the
+    precomputed pipes (manual play has no timeout) extend the arrays from
+    the same random stream, so the course stays a pure function of its seed.
+    """
+
+    def __init__(self, seed=None, length=COURSE_LENGTH):
+        """
+        Args:
+            seed: Course seed, None for a random course
+            length: Number of pipe pairs to precompute
+        """
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.gap_centers = np.empty(0, dtype=np.int64)
+        self.spawn_frames = np.empty(0, dtype=np.int64)
+        self.extend(length)
+
+    def extend(self, length):
+        """Precompute pipe pairs until the course holds at least length of them"""
+        start = len(self.gap_centers)
+        if length <= start:
+            return
+        heights = [_gap_offset(self.rng) for _ in range(length - start)]
+        self.gap_centers = np.concatenate([self.gap_centers, SCREEN_HEIGHT // 2 + np.array(heights, dtype=np.int64)])
+        self.spawn_frames = np.arange(length, dtype=np.int64) * PIPE_FREQUENCY_FRAMES
+
+    @staticmethod
+    def fill(seed, out, rng=None):
+        """
+        Write the first gap centres of a course into an existing array
+
+        Gives the same heights as Course(seed).gap_centers without building
+        a Course or any arrays.
+
+        Args:
+            seed: Course seed
+            out: 1-D integer array to fill, its length is the number of pairs
+            rng: Optional random.Random to reseed and reuse
+        """
+        if rng is None:
+            rng = random.Random()
+        rng.seed(seed)
+        for i in range(len(out)):
+            out[i] = SCREEN_HEIGHT // 2 + _gap_offset(rng)
+
+    def __len__(self):
+        return len(self.gap_centers)
+
+    def spawn_due(self, pipes, next_pipe, frame):
+        """
+        Spawn every pipe pair whose spawn frame has been reached
+
+        Args:
+            pipes: PipeManager to spawn into
+            next_pipe: Index of the first pipe pair not spawned yet
+            frame: Current simulation frame
+
+        Returns:
+            int: Index of the next pipe pair to spawn
+        """
+        while True:
+            if next_pipe >= len(self.gap_centers):
+                self.extend(max(2 * len(self.gap_centers), next_pipe + 1))
+            if self.spawn_frames[next_pipe] > frame:
+                return next_pipe
+            pipes.spawn(int(self.gap_centers[next_pipe]))
+            next_pipe += 1
@@ -0,0 +1,101 @@
+import numpy as np
+
+
+def uniform_crossover(parents_a, parents_b, rng=np.random):
+    """
+    Take every parameter from either parent with equal probability
+
+    Args:
+        parents_a: numpy array of shape (n, param_count)
+        parents_b: numpy array of shape (n, param_count)
+        rng: numpy random module or Generator
+
+    Returns:
+        numpy array of shape (n, param_count) with one child per row
+    """
+    mask = rng.random(parents_a.shape) < 0.5
+    return np.where(mask, parents_a, parents_b)
+
+
+def single_point_crossover(parents_a, parents_b, rng=np.random):
+    """
+    Take parameters before a random cut point from parent a, the rest from parent b
+
+    Args:
+        parents_a: numpy array of shape (n, param_count)
+        parents_b: numpy array of shape (n, param_count)
+        rng: numpy random module or Generator
+
+    Returns:
+        numpy array of shape (n, param_count) with one child per row
+    """
+    n, size = parents_a.shape
+    points = 1 + (rng.random(n) * (size - 1)).astype(np.int64)
+    mask = np.arange(size) < points[:, None]
+    return np.where(mask, parents_a, parents_b)
+
+
+def arithmetic_crossover(parents_a, parents_b, rng=np.random):
+    """
+    Blend both parents with a random weight per child
+
+    Args:
+        parents_a: numpy array of shape (n, param_count)
+        parents_b: numpy array of shape (n, param_count)
+        rng: numpy random module or Generator
+
+    Returns:
+        numpy array of shape (n, param_count) with one child per row
+    """
+    alpha = rng.random((len(parents_a), 1))
+    return alpha * parents_a + (1 - alpha) * parents_b
+
+
+def sbx_crossover(parents_a, parents_b, rng=np.random, eta=15.0):
+    """
+    Simulated binary crossover
+
+    Args:
+        parents_a: numpy array of shape (n, param_count)
+        parents_b: numpy array of shape (n, param_count)
+        rng: numpy random module or Generator
+        eta: Distribution index, larger values keep children closer to the parents
+
+    Returns:
+        numpy array of shape (n, param_count) with one child per row
+    """
+    u = rng.random(parents_a.shape)
+    beta = np.where(u <= 0.5,
+                    (2 * u) ** (1 / (eta + 1)),
+                    (1 / (2 * (1 - u))) ** (1 / (eta + 1)))
+    # Pick one of the two SBX children per parameter
+    sign = np.where(rng.random(parents_a.shape) < 0.5, 1.0, -1.0)
+    return 0.5 * ((parents_a + parents_b) + sign * beta * (parents_a - parents_b))
+
+
+CROSSOVER_METHODS = {
+    'uniform': uniform_crossover,
+    'single_point': single_point_crossover,
+    'arithmetic': arithmetic_crossover,
+    'sbx': sbx_crossover,
+}
+
+
+def crossover_population(parents_a, parents_b, method='uniform', rng=np.random, **kwargs):
+    """
+    Produce one child per parent pair in a single batched call
+
+    Args:
+        parents_a: numpy array of shape (n, param_count)
+        parents_b: numpy array of shape (n, param_count)
+        method: One of CROSSOVER_METHODS
+        rng: numpy random module or Generator
+        **kwargs: Extra options for the method (e.g. eta for 'sbx')
+
+    Returns:
+        numpy array of shape (n, param_count) with the same dtype as the parents
+    """
+    if method not in CROSSOVER_METHODS:
+        raise ValueError(f"Unknown crossover method: {method}")
+    children = CROSSOVER_METHODS[method](parents_a, parents_b, rng, **kwargs)
+    return children.astype(parents_a.dtype, copy=False)
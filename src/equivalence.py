@@ -0,0 +1,128 @@
+import copy
+import pickle
+import numpy as np
+from src.settings import *
+from src.headless import HeadlessGame
+from src.neural_network import NeuralNetwork, PopulationBrain, normalize_inputs
+from src.multi_course import simulate_courses
+from src.vec_env import VecEnv
+
+# The per-bird sprite engine is the reference; every batched path must reproduce
+# it exactly for the same population and course.
+
+
+def _population(size=100, seed=0, generations=3):
+    """Deterministic population, trained for a few generations so episodes run past some pipes"""
+    trainer = HeadlessGame(population_size=size, seed=seed, vectorized=True, course_seed=seed)
+    trainer.train(generations)
+    return trainer.ai_brains
+
+
+def _sprite_fitness(population, course_seed, max_frames=GENERATION_TIMEOUT_FRAMES):
+    trainer = HeadlessGame(population_size=len(population), max_frames=max_frames)
+    trainer.ai_brains = population
+    return np.array(trainer.simulate(course_seed), dtype=np.float64)
+
+
+def check_population_simulator(course_seeds=(0, 1, 2)):
+    """PopulationSimulator (HeadlessGame vectorized) against the sprite engine"""
+    population = _population()
+    trainer = HeadlessGame(population_size=len(population), vectorized=True)
+    trainer.ai_brains = population
+    for course_seed in course_seeds:
+        expected = _sprite_fitness(population, course_seed)
+        actual = np.array(trainer.simulate(course_seed), dtype=np.float64)
+        if not np.array_equal(actual, expected):
+            return False, f"course {course_seed}: {np.count_nonzero(actual != expected)} birds differ"
+    return True, f"{len(population)} birds on {len(course_seeds)} courses"
+
+
+def check_population_brain(samples=1000, seed=0):
+    """PopulationBrain.forward against NeuralNetwork.forward, bit for bit"""
+    population = _population()
+    rng = np.random.default_rng(seed)
+    indices = rng.integers(len(population), size=samples)
+    ranges = [(0, GROUND_Y), (BIRD_JUMP, BIRD_MAX_VELOCITY), (-PIPE_SIZE[0], SCREEN_WIDTH),
+              (0, SCREEN_HEIGHT), (0, SCREEN_HEIGHT)]
+    observations = np.column_stack([rng.uniform(low, high, samples) for low, high in ranges])
+    inputs = normalize_inputs(observations)
+    actual = PopulationBrain(population).forward(inputs, indices)
+    expected = np.array([population[i].forward(row[None, :]) for i, row in zip(indices.tolist(), inputs)])
+    if not np.array_equal(actual, expected):
+        return False, f"{np.count_nonzero(actual != expected)} of {samples} outputs differ"
+    return True, f"{samples} outputs over {len(population)} networks"
+
+
+def check_multi_course(course_seeds=(0, 1, 2, 3)):
+    """simulate_courses against one sprite run per course"""
+    population = _population()
+    actual = simulate_courses(population, course_seeds)
+    for k, course_seed in enumerate(course_seeds):
+        expected = _sprite_fitness(population, course_seed)
+        if not np.array_equal(actual[:, k], expected):
+            return False, f"course {course_seed}: {np.count_nonzero(actual[:, k] != expected)} birds differ"
+    return True, f"{len(population)} birds x {len(course_seeds)} courses in one batch"
+
+
+def check_vec_env(course_seeds=(0, 1, 2)):
+    """VecEnv episode returns against the sprite engine, one environment per bird"""
+    population = _population()
+    brain = PopulationBrain(population)
+    env = VecEnv(len(population))
+    for course_seed in course_seeds:
+        expected = _sprite_fitness(population, course_seed)
+        observations = env.reset([course_seed] * len(population))
+        running = np.ones(len(population), dtype=bool)
+        actual = np.zeros(len(population))
+        while running.any():
+            _, _, done = env.step(brain.predict(observations))
+            finished = done & running
+            actual[finished] = env.final_return[finished]
+            running &= ~done
+        if not np.array_equal(actual, expected):
+            return False, f"course {course_seed}: {np.count_nonzero(actual != expected)} birds differ"
+    return True, f"{len(population)} environments on {len(course_seeds)} courses"
+
+
+def check_network_copies(seed=0):
+    """Deepcopied and unpickled networks keep their layer matrices as views of params"""
+    np.random.seed(seed)
+    network = NeuralNetwork()
+    inputs = np.array([[0.5, 0.5, 0.5, 0.3, 0.6]])
+    for name, clone in (('deepcopy', copy.deepcopy(network)), ('pickle', pickle.loads(pickle.dumps(network)))):
+        if not np.shares_memory(clone.params, clone.weights_input_hidden):
+            return False, f"{name}: layer matrices no longer view params"
+        before = clone.forward(inputs)
+        clone.mutate(mutation_rate=1.0)
+        if clone.forward(inputs) == before or network.forward(inputs) != before:
+            return False, f"{name}: mutate did not change only the copy"
+    return True, "deepcopy and pickle round trips"
+
+
+CHECKS = {
+    'network_copies': check_network_copies,
+    'population_simulator': check_population_simulator,
+    'population_brain': check_population_brain,
+    'multi_course': check_multi_course,
+    'vec_env': check_vec_env,
+}
+
+
+def run_checks(names=None, progress=None):
+    """
+    Run equivalence checks
+
+    Args:
+        names: Check names from CHECKS to run (default all)
+        progress: Optional function called with (name, passed, detail) after each check
+
+    Returns:
+        bool: True if every check passed
+    """
+    passed = True
+    for name in names or CHECKS:
+        ok, detail = CHECKS[name]()
+        if progress:
+            progress(name, ok, detail)
+        passed = passed and ok
+    return passed
@@ -0,0 +1,82 @@
+from collections import OrderedDict
+
+
+class FitnessCache:
+    """Bounded LRU of fitness scores keyed by (genome hash, course seed)
+
+    A bird's fitness depends only on its weights and the pipe course, so a
+    genome that was already flown on a course (an elite carried over, or a
+    child whose mutation changed nothing) does not need to fly it again.
+    """
+
+    def __init__(self, max_size=100000):
+        self.max_size = max_size
+        self.scores = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, genome_hash, course_seed):
+        """
+        Cached fitness of a genome on a course
+
+        Returns:
+            float, or None if the episode has not been seen
+        """
+        key = (genome_hash, course_seed)
+        score = self.scores.get(key)
+        if score is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.scores.move_to_end(key)
+        return score
+
+    def put(self, genome_hash, course_seed, score):
+        self.scores[(genome_hash, course_seed)] = score
+        self.scores.move_to_end((genome_hash, course_seed))
+        if len(self.scores) > self.max_size:
+            self.scores.popitem(last=False)
+
+    def evaluate(self, population, course_seed, simulate):
+        """
+        Fitness of every network, simulating only genomes not seen on this course
+
+        Duplicates within the population are simulated once.
+
+        Args:
+            population: List of NeuralNetwork instances
+            course_seed: Seed for the pipe heights of the episode
+            simulate: Function (networks, course_seed) -> list of fitness scores
+
+        Returns:
+            tuple: (list of fitness scores in population order, number of cache hits)
+        """
+        hashes = [brain.genome_hash() for brain in population]
+        scores = [None] * len(population)
+        pending = {}  # genome hash -> population indices waiting for its simulation
+        for index, genome_hash in enumerate(hashes):
+            if genome_hash in pending:
+                # Same genome twice in one generation - fly it once
+                pending[genome_hash].append(index)
+                self.hits += 1
+            else:
+                score = self.get(genome_hash, course_seed)
+                if score is None:
+                    pending[genome_hash] = [index]
+                else:
+                    scores[index] = score
+        hits = len(population) - len(pending)
+
+        if pending:
+            runs = [indices[0] for indices in pending.values()]
+            results = simulate([population[index] for index in runs], course_seed)
+            for (genome_hash, indices), score in zip(pending.items(), results):
+                self.put(genome_hash, course_seed, score)
+                for index in indices:
+                    scores[index] = score
+        return scores, hits
+
+    def clear(self):
+        self.scores.clear()
+        self.hits = 0
+        self.misses = 0
@@ -1,19 +1,42 @@
 import pygame
 import random
 import sys
+import time
 from src.settings import *
 from src.bird import Bird
-from src.pipe import Pipe
-from src.ui import Button, draw_text, draw_medals
+from src.pipe import PipeManager
+from src.ui import Button, draw_text, draw_medals, render_text, get_overlay, get_panel
 from src.genetic_algorithm import GeneticAlgorithm
+from src.headless import step_ai_birds
+from src.sim_clock import SimClock
+from src.course import Course
+from src.render import DirtyRects, blit_group
+from src.checkpoint import CheckpointWriter, load_checkpoint
+from src.profiler import PROFILER
+from src.replay import ReplayBrain
+from src.policy_export import load_policy
 
 class Game:
-    def __init__(self):
+    def __init__(self, resume=None, checkpoint=None, checkpoint_every=10,
+                 profile_output=None, cprofile_output=None, course_seed=None, replay=None,
+                 policy=None):
+        """
+        Args:
+            resume: Optional checkpoint file to continue AI training from
+            checkpoint: Optional .npz file AI training progress is saved to
+            checkpoint_every: Generations between checkpoints
+            profile_output: Optional .csv/.json file per-generation timings are written to on exit
+            cprofile_output: Optional file the cProfile stats are dumped to on exit
+            course_seed: Play every game on this pipe course instead of a new one each time
+            replay: Optional Replay shown in autonomous mode instead of training
+            policy: Optional trained policy (any Bird brain form or an exported file) flown
+                in autonomous mode instead of training
+        """
         pygame.init()
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Flappy Bird AI 2025")
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.SysFont('Arial', 24)
+        self.sim_clock = SimClock()
 
         # Game State
         self.running = True
@@ -23,7 +46,8 @@ class Game:
 
         # Groups
         self.bird_group = pygame.sprite.GroupSingle()
-        self.pipe_group = pygame.sprite.Group()
+        self.pipes = PipeManager()
+        self.pipe_group = self.pipes.group
         
         self.bird = Bird()
         self.bird_group.add(self.bird)
@@ -32,34 +56,49 @@ class Game:
         self.ai_birds = []
         self.ga = GeneticAlgorithm(population_size=50)
         self.ai_brains = []
-        self.ai_generation_start_time = 0
-        self.ai_speed = 1  # Game speed multiplier for AI training
+        self.ai_speed_index = 0
+        self.ai_speed = AI_SPEED_LEVELS[0]  # Simulation steps per rendered frame
+        self.sim_steps = 0
+        self.sim_sps = 0  # Achieved simulation steps per second
+        self.sps_timer = time.perf_counter()
+        if resume:
+            self.ai_brains = load_checkpoint(resume, self.ga)
+        self.checkpointer = CheckpointWriter(checkpoint, checkpoint_every) if checkpoint else None
+        
+        # Profiling
+        self.profile_output = profile_output
+        self.cprofile_output = cprofile_output
+        self.last_profile = None
 
         # Background
-        self.bg_img = load_image('background-day.png')
-        if self.bg_img:
-            self.bg_img = pygame.transform.scale(self.bg_img, (SCREEN_WIDTH, SCREEN_HEIGHT))
-        else:
+        self.bg_img = ASSETS.get('background-day.png', size=(SCREEN_WIDTH, SCREEN_HEIGHT))
+        if not self.bg_img:
             self.bg_img = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
             self.bg_img.fill(SKY_BLUE)
 
         # Ground
-        self.ground_img = load_image('base.png')
-        if self.ground_img:
-            self.ground_img = pygame.transform.scale2x(self.ground_img)
-        else:
+        self.ground_img = ASSETS.get('base.png', scale2x=True)
+        if not self.ground_img:
             self.ground_img = pygame.Surface((SCREEN_WIDTH, 100))
             self.ground_img.fill((222, 184, 135))
         self.ground_scroll = 0
-        self.ground_y = SCREEN_HEIGHT - 100
+        self.ground_y = GROUND_Y
 
         # Game Variables
         self.score = 0
         self.high_score_manual = 0
         self.high_score_auto = 0
-        self.last_pipe = pygame.time.get_ticks()
+        self.course_seed = course_seed
+        self.replay = replay
+        self.policy = load_policy(policy) if isinstance(policy, str) else policy
+        self.course = None
+        self.next_pipe = 0
         self.pass_pipe = False
 
+        # Rendering: only changed regions are pushed to the display
+        self.dirty = DirtyRects()
+        self.last_static_key = None
+
         # UI Elements
         self.btn_manual = Button(SCREEN_WIDTH//2 - 100, 300, 200, 50, "Manual Mode", (200, 200, 200))
         self.btn_auto = Button(SCREEN_WIDTH//2 - 100, 370, 200, 50, "Autonomous Mode", (200, 200, 200))
@@ -69,13 +108,30 @@ class Game:
         self.btn_menu = Button(SCREEN_WIDTH//2 - 50, 360, 100, 40, "Menu", (200, 200, 200))
 
     def reset_game(self):
-        self.pipe_group.empty()
+        self.pipes.clear()
         self.score = 0
         self.game_active = True
         
+        # Generation time is counted in frames; first pipe pair appears immediately
+        self.sim_clock.reset()
+        if self.replay is not None and self.game_mode == 'auto':
+            seed = self.replay.course_seed
+        elif self.course_seed is not None:
+            seed = self.course_seed
+        else:
+            seed = random.randrange(2 ** 32)
+        if self.course is None or self.course.seed != seed:
+            self.course = Course(seed)
+        self.next_pipe = 0
+        
         if self.game_mode == 'manual':
             self.bird.reset()
             self.bird_group.add(self.bird)
+        elif self.replay is not None:
+            # A replay flies a single bird that repeats the recorded jumps
+            self.ai_birds = [Bird(brain=ReplayBrain(self.replay.jumps))]
+        elif self.policy is not None:
+            self.ai_birds = [Bird(brain=self.policy)]
         else:  # AI mode
             # Initialize AI population
             if not self.ai_brains:
@@ -85,16 +141,12 @@ class Game:
             for brain in self.ai_brains:
                 bird = Bird(brain=brain)
                 self.ai_birds.append(bird)
-            
-            self.ai_generation_start_time = pygame.time.get_ticks()
 
     def run(self):
         while self.running:
-            # AI training speed up
-            if self.state == 'GAME' and self.game_mode == 'auto' and self.game_active:
-                dt = self.clock.tick(FPS * self.ai_speed)
-            else:
-                self.clock.tick(FPS)
+            # Rendering always runs at the display rate; AI speed only changes
+            # how many simulation steps happen between two rendered frames
+            self.clock.tick(FPS)
             
             # Event Handling
             for event in pygame.event.get():
@@ -130,9 +182,9 @@ class Game:
                         elif self.game_mode == 'auto':
                             # Adjust AI speed with mouse clicks
                             if event.button == 1:  # Left click - speed up
-                                self.ai_speed = min(self.ai_speed + 1, 10)
+                                self.set_ai_speed(self.ai_speed_index + 1)
                             elif event.button == 3:  # Right click - slow down
-                                self.ai_speed = max(self.ai_speed - 1, 1)
+                                self.set_ai_speed(self.ai_speed_index - 1)
 
                     elif self.state == 'GAMEOVER':
                         if self.btn_replay.is_clicked(pos):
@@ -144,93 +196,172 @@ class Game:
                     if event.key == pygame.K_SPACE and self.state == 'GAME' and self.game_mode == 'manual' and self.game_active:
                         self.bird.jump()
 
-            # Drawing Background
-            self.screen.blit(self.bg_img, (0, 0))
-
-            # State Machine
-            if self.state == 'MENU':
-                self.draw_menu()
-            elif self.state == 'HIGHSCORE':
-                self.draw_highscore()
-            elif self.state == 'TUTORIAL':
-                self.draw_tutorial()
-            elif self.state == 'GAME':
-                self.update_game()
-                self.draw_game()
-            elif self.state == 'GAMEOVER':
-                self.draw_game_over()
-
-            # Draw Ground
-            self.screen.blit(self.ground_img, (self.ground_scroll, self.ground_y))
-            if self.state == 'GAME' and self.game_active:
-                self.ground_scroll -= PIPE_SPEED
-                if abs(self.ground_scroll) > 35:
-                    self.ground_scroll = 0
-
-            pygame.display.update()
+            if self.state == 'GAME':
+                self.run_simulation()
+            self.render()
 
+        if self.checkpointer:
+            self.checkpointer.close(self.ga, self.ai_brains)
+        if self.profile_output:
+            PROFILER.export(self.profile_output)
+        if self.cprofile_output:
+            PROFILER.stop_cprofile(self.cprofile_output)
         pygame.quit()
         sys.exit()
 
+    def static_screen_key(self):
+        """
+        Key describing the contents of a static screen
+        
+        Returns:
+            tuple, or None while the game is running and the screen changes every frame
+        """
+        if self.state == 'MENU':
+            return ('MENU', id(self.bird.image))
+        if self.state == 'HIGHSCORE':
+            return ('HIGHSCORE', self.high_score_manual, self.high_score_auto)
+        if self.state == 'TUTORIAL':
+            return ('TUTORIAL', self.game_mode, id(self.bird.image))
+        if self.state == 'GAMEOVER':
+            return ('GAMEOVER', self.game_mode, self.score, self.high_score_manual, self.high_score_auto)
+        return None
+
+    def render(self):
+        """Redraw the frame and push only the regions that changed"""
+        static_key = self.static_screen_key()
+        if static_key is not None and static_key == self.last_static_key:
+            # Static screen already on display - nothing to draw or push
+            return
+        
+        # Drawing Background
+        with PROFILER.phase('draw_sprites'):
+            self.screen.blit(self.bg_img, (0, 0))
+
+        # State Machine (draw_game times its sprites and its UI separately)
+        if self.state == 'GAME':
+            self.draw_game()
+        else:
+            with PROFILER.phase('draw_ui'):
+                if self.state == 'MENU':
+                    self.draw_menu()
+                elif self.state == 'HIGHSCORE':
+                    self.draw_highscore()
+                elif self.state == 'TUTORIAL':
+                    self.draw_tutorial()
+                elif self.state == 'GAMEOVER':
+                    self.draw_game_over()
+
+        # Draw Ground
+        with PROFILER.phase('draw_sprites'):
+            self.dirty.add(self.screen.blit(self.ground_img, (self.ground_scroll, self.ground_y)))
+
+        with PROFILER.phase('display'):
+            if static_key is not None or self.last_static_key is not None:
+                # Entering or changing a static screen - push everything once
+                pygame.display.update()
+                self.dirty.reset()
+            else:
+                pygame.display.update(self.dirty.flush())
+        self.last_static_key = static_key
+
     def draw_menu(self):
-        draw_text(self.screen, "FLAPPY BIRD AI 2025", 30, SCREEN_WIDTH//2, 100)
+        self.screen.blit(get_overlay(('menu',), self._draw_menu_overlay), (0, 0))
         # Draw bird in midflight
         bird_rect = self.bird.image.get_rect(center=(SCREEN_WIDTH//2, 200))
         self.screen.blit(self.bird.image, bird_rect)
+
+    def _draw_menu_overlay(self, surface):
+        draw_text(surface, "FLAPPY BIRD AI 2025", 30, SCREEN_WIDTH//2, 100)
+        draw_text(surface, "© 2025 Schneider & Freunde", 15, SCREEN_WIDTH//2, SCREEN_HEIGHT - 30)
         
-        draw_text(self.screen, "© 2025 Schneider & Freunde", 15, SCREEN_WIDTH//2, SCREEN_HEIGHT - 30)
-        
-        self.btn_manual.draw(self.screen)
-        self.btn_auto.draw(self.screen)
-        self.btn_highscore.draw(self.screen)
+        self.btn_manual.draw(surface)
+        self.btn_auto.draw(surface)
+        self.btn_highscore.draw(surface)
 
     def draw_highscore(self):
-        draw_text(self.screen, "HIGH SCORES", 30, SCREEN_WIDTH//2, 100)
+        key = ('highscore', self.high_score_manual, self.high_score_auto)
+        self.screen.blit(get_overlay(key, self._draw_highscore_overlay), (0, 0))
+
+    def _draw_highscore_overlay(self, surface):
+        draw_text(surface, "HIGH SCORES", 30, SCREEN_WIDTH//2, 100)
         
-        pygame.draw.rect(self.screen, (240, 230, 140), (40, 150, SCREEN_WIDTH-80, 200), border_radius=10)
-        pygame.draw.rect(self.screen, BLACK, (40, 150, SCREEN_WIDTH-80, 200), 2, border_radius=10)
+        pygame.draw.rect(surface, (240, 230, 140), (40, 150, SCREEN_WIDTH-80, 200), border_radius=10)
+        pygame.draw.rect(surface, BLACK, (40, 150, SCREEN_WIDTH-80, 200), 2, border_radius=10)
         
-        draw_text(self.screen, f"Manual: {self.high_score_manual}", 25, SCREEN_WIDTH//2, 200)
-        draw_text(self.screen, f"Auto: {self.high_score_auto}", 25, SCREEN_WIDTH//2, 280)
+        draw_text(surface, f"Manual: {self.high_score_manual}", 25, SCREEN_WIDTH//2, 200)
+        draw_text(surface, f"Auto: {self.high_score_auto}", 25, SCREEN_WIDTH//2, 280)
         
-        draw_text(self.screen, "Click to return", 15, SCREEN_WIDTH//2, 400)
+        draw_text(surface, "Click to return", 15, SCREEN_WIDTH//2, 400)
 
     def draw_tutorial(self):
-        draw_text(self.screen, "GET READY!", 40, SCREEN_WIDTH//2, 150)
+        self.screen.blit(get_overlay(('tutorial', self.game_mode), self._draw_tutorial_overlay), (0, 0))
         
         if self.game_mode == 'manual':
-            draw_text(self.screen, "Tap or Space to Fly", 20, SCREEN_WIDTH//2, 250)
             # Show bird
             self.bird.rect.center = (50, SCREEN_HEIGHT // 2)
             self.screen.blit(self.bird.image, self.bird.rect)
+
+    def _draw_tutorial_overlay(self, surface):
+        draw_text(surface, "GET READY!", 40, SCREEN_WIDTH//2, 150)
+        
+        if self.game_mode == 'manual':
+            draw_text(surface, "Tap or Space to Fly", 20, SCREEN_WIDTH//2, 250)
         else:
-            draw_text(self.screen, "Neural Network Training", 20, SCREEN_WIDTH//2, 220)
-            draw_text(self.screen, "Population: 50 Birds", 15, SCREEN_WIDTH//2, 250)
-            draw_text(self.screen, "Genetic Algorithm Active", 15, SCREEN_WIDTH//2, 270)
+            draw_text(surface, "Neural Network Training", 20, SCREEN_WIDTH//2, 220)
+            draw_text(surface, "Population: 50 Birds", 15, SCREEN_WIDTH//2, 250)
+            draw_text(surface, "Genetic Algorithm Active", 15, SCREEN_WIDTH//2, 270)
             
-        draw_text(self.screen, "Tap to Start", 15, SCREEN_WIDTH//2, 400)
+        draw_text(surface, "Tap to Start", 15, SCREEN_WIDTH//2, 400)
+
+    def set_ai_speed(self, index):
+        self.ai_speed_index = min(max(index, 0), len(AI_SPEED_LEVELS) - 1)
+        self.ai_speed = AI_SPEED_LEVELS[self.ai_speed_index]
+
+    def run_simulation(self):
+        """
+        Run the simulation steps for one rendered frame
+        
+        Manual play advances one step per frame. AI training runs ai_speed
+        steps, cut short once SIM_FRAME_BUDGET is used up so the window
+        keeps rendering at FPS.
+        """
+        steps_wanted = 1 if self.game_mode == 'manual' else self.ai_speed
+        deadline = time.perf_counter() + SIM_FRAME_BUDGET
+        steps = 0
+        while steps < steps_wanted and self.state == 'GAME' and self.game_active:
+            self.update_game()
+            steps += 1
+            if time.perf_counter() >= deadline:
+                break
+        
+        # Achieved steps per second, refreshed twice a second
+        self.sim_steps += steps
+        now = time.perf_counter()
+        if now - self.sps_timer >= 0.5:
+            self.sim_sps = int(self.sim_steps / (now - self.sps_timer))
+            self.sim_steps = 0
+            self.sps_timer = now
 
     def update_game(self):
         if self.game_active:
             # Pipe Generation
-            current_time = pygame.time.get_ticks()
-            if current_time - self.last_pipe > PIPE_FREQUENCY:
-                pipe_height = random.randint(-100, 100)
-                btm_pipe = Pipe(SCREEN_WIDTH, SCREEN_HEIGHT // 2 + pipe_height, -1)
-                top_pipe = Pipe(SCREEN_WIDTH, SCREEN_HEIGHT // 2 + pipe_height, 1)
-                self.pipe_group.add(btm_pipe)
-                self.pipe_group.add(top_pipe)
-                self.last_pipe = current_time
+            self.next_pipe = self.course.spawn_due(self.pipes, self.next_pipe, self.sim_clock.frame)
+            self.sim_clock.tick()
 
             if self.game_mode == 'manual':
                 self.update_manual_mode()
             else:
                 self.update_ai_mode()
+            
+            # Scroll the ground with the pipes
+            self.ground_scroll -= PIPE_SPEED
+            if abs(self.ground_scroll) > 35:
+                self.ground_scroll = 0
     
     def update_manual_mode(self):
         """Update game for manual mode"""
         self.bird_group.update()
-        self.pipe_group.update()
+        self.pipes.update()
 
         # Collision
         if pygame.sprite.groupcollide(self.bird_group, self.pipe_group, False, False) or \
@@ -240,85 +371,68 @@ class Game:
             self.update_high_score()
 
         # Score - Check if bird passed pipe
-        if len(self.pipe_group) > 0:
-            # Get the first pipe in the group (they come in pairs)
-            first_pipe = self.pipe_group.sprites()[0]
+        first_pipe = self.pipes.first()
+        if first_pipe:
             
             # If bird is past the pipe and hasn't scored yet
-            if self.bird.rect.left > first_pipe.rect.right and not self.pass_pipe:
+            if self.bird.rect.left > first_pipe.right and not self.pass_pipe:
                 self.score += 1
                 self.pass_pipe = True
             
             # Reset flag when bird is before the next pipe (ready to score again)
-            if self.pass_pipe and self.bird.rect.left < first_pipe.rect.left:
+            if self.pass_pipe and self.bird.rect.left < first_pipe.left:
                 self.pass_pipe = False
     
     def update_ai_mode(self):
         """Update game for AI training mode"""
         # Update pipes
-        self.pipe_group.update()
+        with PROFILER.phase('pipes'):
+            self.pipes.update()
         
         # AI birds think and act
-        alive_count = 0
-        for bird in self.ai_birds:
-            if bird.alive:
-                alive_count += 1
-                
-                # Think and decide
-                if bird.think(self.pipe_group.sprites()):
-                    bird.jump()
-                
-                # Update bird
-                bird.update()
-                
-                # Increase fitness for staying alive
-                bird.fitness += 0.1
-                
-                # Bonus fitness for passing pipes
-                if len(self.pipe_group) > 0:
-                    first_pipe = self.pipe_group.sprites()[0]
-                    if bird.rect.left > first_pipe.rect.left and bird.rect.right < first_pipe.rect.right:
-                        bird.fitness += 0.5
-                    elif bird.rect.left > first_pipe.rect.right:
-                        bird.fitness += 5.0
-                
-                # Check collision
-                bird_group_temp = pygame.sprite.GroupSingle(bird)
-                if pygame.sprite.groupcollide(bird_group_temp, self.pipe_group, False, False) or \
-                   bird.rect.top <= 0 or bird.rect.bottom >= self.ground_y:
-                    bird.alive = False
+        alive_count = step_ai_birds(self.ai_birds, self.pipes, self.ground_y)
+        PROFILER.count('frames')
         
         # Update score (track best bird)
         best_fitness = max([bird.fitness for bird in self.ai_birds])
         self.score = int(best_fitness)
         
         # Check if all birds are dead or timeout
-        generation_time = pygame.time.get_ticks() - self.ai_generation_start_time
-        if alive_count == 0 or generation_time > 30000:  # 30 second timeout
+        if self.replay is not None or self.policy is not None:
+            max_frames = self.replay.max_frames if self.replay is not None else GENERATION_TIMEOUT_FRAMES
+            if alive_count == 0 or self.sim_clock.frame > max_frames:
+                self.game_active = False
+                self.state = 'GAMEOVER'
+            return
+        if alive_count == 0 or self.sim_clock.frame > GENERATION_TIMEOUT_FRAMES:
             self.evolve_population()
-            self.reset_game()  # Start new generation
+            with PROFILER.phase('reset'):
+                self.reset_game()  # Start new generation
 
     def draw_game(self):
-        self.pipe_group.draw(self.screen)
+        with PROFILER.phase('draw_sprites'):
+            blit_group(self.screen, self.pipe_group, self.dirty)
+            if self.game_mode == 'manual':
+                blit_group(self.screen, self.bird_group, self.dirty)
+            else:
+                # Draw all alive AI birds - they share one column, so track it as a single region
+                bird_rects = [self.screen.blit(bird.image, bird.rect) for bird in self.ai_birds if bird.alive]
+                if bird_rects:
+                    self.dirty.add(bird_rects[0].unionall(bird_rects[1:]))
         
-        if self.game_mode == 'manual':
-            self.bird_group.draw(self.screen)
-        else:
-            # Draw all alive AI birds
-            for bird in self.ai_birds:
-                if bird.alive:
-                    self.screen.blit(bird.image, bird.rect)
-            
+        with PROFILER.phase('draw_ui'):
+            self.draw_game_ui()
+
+    def draw_game_ui(self):
+        """Stats panels over the running game, or the score in manual mode"""
+        if self.game_mode != 'manual':
             # Draw AI stats
             stats = self.ga.get_stats([bird.fitness for bird in self.ai_birds])
             alive_count = sum(1 for bird in self.ai_birds if bird.alive)
             
             # Stats panel
             panel_height = 120
-            panel = pygame.Surface((SCREEN_WIDTH, panel_height))
-            panel.set_alpha(200)
-            panel.fill((50, 50, 50))
-            self.screen.blit(panel, (0, 0))
+            self.dirty.add(self.screen.blit(get_panel(SCREEN_WIDTH, panel_height, (50, 50, 50), 200), (0, 0)))
             
             draw_text(self.screen, f"Gen: {stats['generation']}", 15, 60, 15, WHITE)
             draw_text(self.screen, f"Alive: {alive_count}/{len(self.ai_birds)}", 15, 60, 35, WHITE)
@@ -326,35 +440,55 @@ class Game:
             draw_text(self.screen, f"Avg: {int(stats['avg_fitness'])}", 15, 60, 75, WHITE)
             draw_text(self.screen, f"Record: {int(stats['best_ever'])}", 15, 60, 95, WHITE)
             
-            draw_text(self.screen, f"Speed: {self.ai_speed}x", 15, SCREEN_WIDTH - 50, 15, WHITE)
+            speed = "Turbo" if self.ai_speed == TURBO else f"{self.ai_speed}x"
+            draw_text(self.screen, f"Speed: {speed}", 15, SCREEN_WIDTH - 50, 15, WHITE)
             draw_text(self.screen, "L-Click: Speed Up", 12, SCREEN_WIDTH - 80, 35, WHITE)
             draw_text(self.screen, "R-Click: Slow Down", 12, SCREEN_WIDTH - 80, 50, WHITE)
+            draw_text(self.screen, f"{self.sim_sps} steps/s", 12, SCREEN_WIDTH - 80, 70, WHITE)
+            
+            if PROFILER.enabled:
+                self.draw_profile_panel(panel_height)
         
         # Draw Score (for manual mode, or best fitness for AI)
         if self.game_mode == 'manual':
-            score_surf = self.font.render(str(self.score), True, WHITE)
+            score_surf = render_text(str(self.score), 24, WHITE, bold=False)
             score_rect = score_surf.get_rect(center=(SCREEN_WIDTH//2, 50))
-            self.screen.blit(score_surf, score_rect)
+            self.dirty.add(self.screen.blit(score_surf, score_rect))
+
+    def draw_profile_panel(self, top, rows=4):
+        """Show where the last finished generation spent its time"""
+        if not self.last_profile:
+            return
+        times = PROFILER.breakdown(self.last_profile)
+        
+        height = 10 + 15 * min(rows, len(times))
+        self.dirty.add(self.screen.blit(get_panel(SCREEN_WIDTH, height, (30, 30, 30), 180), (0, top)))
+        for row, (name, ms, share) in enumerate(times[:rows]):
+            draw_text(self.screen, f"{name}: {ms:.0f} ms ({share:.0%})", 12, SCREEN_WIDTH // 2, top + 12 + 15 * row, WHITE)
 
     def draw_game_over(self):
         # Draw game elements frozen
         self.pipe_group.draw(self.screen)
         self.bird_group.draw(self.screen)
         
+        best = self.high_score_manual if self.game_mode == 'manual' else self.high_score_auto
+        self.screen.blit(get_overlay(('gameover', self.score, best), self._draw_game_over_overlay), (0, 0))
+
+    def _draw_game_over_overlay(self, surface):
         # Game Over Box
         box_rect = pygame.Rect(40, 150, SCREEN_WIDTH-80, 250)
-        pygame.draw.rect(self.screen, (222, 216, 149), box_rect, border_radius=10)
-        pygame.draw.rect(self.screen, (84, 56, 71), box_rect, 3, border_radius=10)
+        pygame.draw.rect(surface, (222, 216, 149), box_rect, border_radius=10)
+        pygame.draw.rect(surface, (84, 56, 71), box_rect, 3, border_radius=10)
         
-        draw_text(self.screen, "GAME OVER", 35, SCREEN_WIDTH//2, 120, (255, 100, 100))
+        draw_text(surface, "GAME OVER", 35, SCREEN_WIDTH//2, 120, (255, 100, 100))
         
-        draw_text(self.screen, f"Score: {self.score}", 20, SCREEN_WIDTH//2 + 30, 190)
-        draw_text(self.screen, f"Best: {self.high_score_manual if self.game_mode == 'manual' else self.high_score_auto}", 20, SCREEN_WIDTH//2 + 30, 230)
+        draw_text(surface, f"Score: {self.score}", 20, SCREEN_WIDTH//2 + 30, 190)
+        draw_text(surface, f"Best: {self.high_score_manual if self.game_mode == 'manual' else self.high_score_auto}", 20, SCREEN_WIDTH//2 + 30, 230)
         
-        draw_medals(self.screen, self.score)
+        draw_medals(surface, self.score)
         
-        self.btn_replay.draw(self.screen)
-        self.btn_menu.draw(self.screen)
+        self.btn_replay.draw(surface)
+        self.btn_menu.draw(surface)
 
     def update_high_score(self):
         if self.game_mode == 'manual':
@@ -368,6 +502,9 @@ class Game:
         """Evolve the AI bird population using genetic algorithm"""
         fitness_scores = [bird.fitness for bird in self.ai_birds]
         self.ai_brains = self.ga.evolve(self.ai_brains, fitness_scores)
+        self.last_profile = PROFILER.end_generation(self.ga.generation - 1)
+        if self.checkpointer:
+            self.checkpointer.maybe_save(self.ga, self.ai_brains)
         
         # Update high score with best fitness
         stats = self.ga.get_stats(fitness_scores)
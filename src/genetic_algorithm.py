@@ -1,10 +1,15 @@
-import random
-from src.neural_network import NeuralNetwork
+import numpy as np
+from src.neural_network import NeuralNetwork, population_matrix, networks_from_matrix
+from src.crossover import crossover_population
+from src.selection import select_indices, select_elites
+from src.profiler import PROFILER
 
 class GeneticAlgorithm:
     """Genetic Algorithm to evolve bird brains"""
     
-    def __init__(self, population_size=50, mutation_rate=0.1, mutation_strength=0.5):
+    def __init__(self, population_size=50, mutation_rate=0.1, mutation_strength=0.5,
+                 crossover_method='uniform', crossover_rate=0.8,
+                 selection_method='tournament', tournament_size=5):
         """
         Initialize genetic algorithm
         
@@ -12,21 +17,45 @@ class GeneticAlgorithm:
             population_size: Number of birds per generation
             mutation_rate: Probability of mutating each weight
             mutation_strength: Standard deviation of mutations
+            crossover_method: 'uniform', 'single_point', 'arithmetic' or 'sbx'
+            crossover_rate: Probability that a child is bred rather than cloned
+            selection_method: 'tournament', 'rank', 'roulette' or 'sus'
+            tournament_size: Contestants per tournament
         """
         self.population_size = population_size
         self.mutation_rate = mutation_rate
         self.mutation_strength = mutation_strength
+        self.crossover_method = crossover_method
+        self.crossover_rate = crossover_rate
+        self.selection_method = selection_method
+        self.tournament_size = tournament_size
         self.generation = 1
         self.best_fitness = 0
         self.best_brain = None
+        self.history = []  # get_stats() of every evolved generation
         
     def create_population(self):
         """Create initial population of neural networks"""
         return [NeuralNetwork() for _ in range(self.population_size)]
     
+    def select_parent_indices(self, fitness_scores, count):
+        """
+        Select parents for count children in one batched draw
+        
+        Args:
+            fitness_scores: List or numpy array of fitness scores
+            count: Number of children to breed
+        
+        Returns:
+            tuple: Two numpy arrays of shape (count,) with population indices
+        """
+        kwargs = {'tournament_size': self.tournament_size} if self.selection_method == 'tournament' else {}
+        indices = select_indices(fitness_scores, 2 * count, self.selection_method, **kwargs)
+        return indices[:count], indices[count:]
+    
     def select_parents(self, population, fitness_scores):
         """
-        Select parents for breeding using tournament selection
+        Select parents for breeding using the configured selection method
         
         Args:
             population: List of NeuralNetwork instances
@@ -35,18 +64,8 @@ class GeneticAlgorithm:
         Returns:
             tuple: Two parent networks
         """
-        tournament_size = 5
-        
-        def tournament():
-            """Run a tournament to select one parent"""
-            contestants = random.sample(list(zip(population, fitness_scores)), 
-                                       min(tournament_size, len(population)))
-            winner = max(contestants, key=lambda x: x[1])
-            return winner[0]
-        
-        parent1 = tournament()
-        parent2 = tournament()
-        return parent1, parent2
+        index_a, index_b = self.select_parent_indices(fitness_scores, 1)
+        return population[index_a[0]], population[index_b[0]]
     
     def evolve(self, population, fitness_scores):
         """
@@ -67,35 +86,60 @@ class GeneticAlgorithm:
         if fitness_scores[max_fitness_idx] > self.best_fitness:
             self.best_fitness = fitness_scores[max_fitness_idx]
             self.best_brain = population[max_fitness_idx].copy()
+        self.history.append(self.get_stats(fitness_scores))
         
-        new_population = []
+        parents = population_matrix(population)
+        fitness = np.asarray(fitness_scores, dtype=np.float64)
         
         # Elitism - keep top 10% performers
-        elite_count = max(1, self.population_size // 10)
-        sorted_population = sorted(zip(population, fitness_scores), 
-                                  key=lambda x: x[1], reverse=True)
-        
-        for i in range(elite_count):
-            new_population.append(sorted_population[i][0].copy())
+        with PROFILER.phase('elitism'):
+            elite_count = max(1, self.population_size // 10)
+            matrix = parents[select_elites(fitness, elite_count)][:self.population_size]
         
         # Create rest of population through crossover and mutation
-        while len(new_population) < self.population_size:
-            parent1, parent2 = self.select_parents(population, fitness_scores)
-            
-            # Crossover
-            if random.random() < 0.8:  # 80% crossover rate
-                child = parent1.crossover(parent2)
-            else:
-                child = parent1.copy()
-            
-            # Mutation
-            child.mutate(self.mutation_rate, self.mutation_strength)
-            
-            new_population.append(child)
+        child_count = self.population_size - len(matrix)
+        if child_count > 0:
+            with PROFILER.phase('selection'):
+                index_a, index_b = self.select_parent_indices(fitness, child_count)
+            with PROFILER.phase('breeding'):
+                children = self.breed(parents[index_a], parents[index_b])
+            matrix = np.concatenate([matrix, children])
+        
+        first = population[0]
+        new_population = networks_from_matrix(matrix, first.input_size, first.hidden_size, first.output_size)
         
         self.generation += 1
         return new_population
     
+    def breed(self, parents_a, parents_b):
+        """
+        Produce one mutated child per parent pair in a single batched pass
+        
+        Args:
+            parents_a: numpy array of shape (n, param_count) with the first parents
+            parents_b: numpy array of shape (n, param_count) with the second parents
+        
+        Returns:
+            numpy array of shape (n, param_count) with child parameters
+        """
+        # Crossover for most pairs, plain clones of the first parent for the rest
+        children = crossover_population(parents_a, parents_b, self.crossover_method)
+        cloned = np.random.random(len(children)) >= self.crossover_rate
+        children[cloned] = parents_a[cloned]
+        
+        self.mutate_population(children)
+        return children
+    
+    def mutate_population(self, matrix):
+        """
+        Mutate every genome of a population matrix in place
+        
+        Args:
+            matrix: numpy array of shape (population_size, param_count)
+        """
+        mask = np.random.random(matrix.shape) < self.mutation_rate
+        matrix += mask * np.random.randn(*matrix.shape) * self.mutation_strength
+    
     def get_stats(self, fitness_scores):
         """
         Get statistics about current generation
@@ -0,0 +1,302 @@
+import random
+import numpy as np
+import pygame
+from src.settings import *
+from src.bird import Bird
+from src.pipe import PipeManager
+from src.observation import build_observations, gap_features
+from src.genetic_algorithm import GeneticAlgorithm
+from src.neural_network import PopulationBrain
+from src.sim_clock import SimClock
+from src.checkpoint import load_checkpoint
+from src.population import PopulationSimulator
+from src.course import Course
+from src.multi_course import simulate_courses, aggregate_fitness
+from src.profiler import PROFILER
+
+
+def step_ai_birds(birds, pipes, ground_y=GROUND_Y):
+    """
+    Advance every alive AI bird by one frame
+
+    Shared by the windowed game and the headless engine so both
+    train on exactly the same rules.
+
+    Args:
+        birds: List of Bird instances
+        pipes: PipeManager (already moved this frame)
+        ground_y: Y coordinate of the ground
+
+    Returns:
+        int: Number of birds that were alive at the start of the frame
+    """
+    bounds = pipes.bounds()
+    alive_birds = [bird for bird in birds if bird.alive]
+
+    # Think and decide (birds do not interact, so each phase can run over all birds)
+    with PROFILER.phase('think'):
+        observations = build_observations(bounds, alive_birds)
+        for bird, observation in zip(alive_birds, observations):
+            if bird.brain and bird.brain.predict(*observation):
+                bird.jump()
+
+    with PROFILER.phase('physics'):
+        for bird in alive_birds:
+            # Update bird
+            bird.update()
+
+            # Increase fitness for staying alive
+            bird.fitness += 0.1
+
+            # Bonus fitness for passing pipes
+            if len(bounds):
+                first_left, first_right = bounds[0, 0], bounds[0, 1]
+                if bird.rect.left > first_left and bird.rect.right < first_right:
+                    bird.fitness += 0.5
+                elif bird.rect.left > first_right:
+                    bird.fitness += 5.0
+
+    # Check collision
+    with PROFILER.phase('collision'):
+        for bird in alive_birds:
+            if pygame.sprite.spritecollideany(bird, pipes.group) or \
+               bird.rect.top <= 0 or bird.rect.bottom >= ground_y:
+                bird.alive = False
+
+    return len(alive_birds)
+
+
+class HeadlessGame:
+    """Display-free training engine - no window, no surfaces, no clock"""
+
+    def __init__(self, population_size=50, seed=None, max_frames=GENERATION_TIMEOUT_FRAMES,
+                 vectorized=False, ga=None, evaluator=None, fitness_cache=None, course_seed=None,
+                 episodes=1, aggregate='mean', quantile=0.25):
+        """
+        Initialize headless training engine
+
+        Args:
+            population_size: Number of birds per generation
+            seed: Seed for pipe heights and network initialisation
+            max_frames: Frames before a generation is cut off
+            vectorized: Step birds as NumPy arrays instead of Bird sprites
+            ga: Optional preconfigured GeneticAlgorithm (population_size is then ignored)
+            evaluator: Optional ParallelEvaluator that runs episodes in worker processes
+            fitness_cache: Optional FitnessCache used to skip genomes already flown on a course
+            course_seed: Fly every generation on this course instead of a fresh one each time
+            episodes: Courses every genome flies per generation (more than one runs as a single batch)
+            aggregate: How episode scores become one fitness - 'mean', 'min' or 'quantile'
+            quantile: Quantile used by the 'quantile' aggregate
+        """
+        self.ga = ga if ga else GeneticAlgorithm(population_size=population_size)
+        self.rng = random.Random(seed)
+        if seed is not None:
+            np.random.seed(seed)
+            random.seed(seed)
+        self.max_frames = max_frames
+        self.vectorized = vectorized
+        self.evaluator = evaluator
+        self.fitness_cache = fitness_cache
+        self.course_seed = course_seed
+        self.episodes = episodes
+        self.aggregate = aggregate
+        self.quantile = quantile
+        self.cache_hits = 0
+        self.frame_callback = None  # Called with the engine after every simulated frame; returning True ends the episode
+        self.last_course_seed = None
+        self.simulator = None
+        self.population_brain = None
+        self.alive_ids = None
+        self.alive_brain = None
+        self.course = None
+
+        self.pipes = PipeManager(headless=True)
+        self.ai_birds = []
+        self.ai_brains = []
+        self.clock = SimClock()
+        self.next_pipe = 0
+
+    def reset_game(self, course_seed=None, brains=None):
+        """
+        Start a new generation from the current brains
+
+        Args:
+            course_seed: Seed for the pipe heights of this episode
+            brains: Networks to fly instead of the whole population
+        """
+        self.pipes.clear()
+        if self.course is None or course_seed is None or self.course.seed != course_seed:
+            self.course = Course(course_seed)
+        if not self.ai_brains:
+            self.ai_brains = self.ga.create_population()
+        if brains is None:
+            brains = self.ai_brains
+
+        if self.vectorized:
+            self.ai_birds = []
+            if self.simulator is None or self.simulator.population_size != len(brains):
+                self.simulator = PopulationSimulator(len(brains))
+            self.simulator.reset()
+            self.population_brain = PopulationBrain(brains)
+            # Brain over the birds still alive, rebuilt only when one dies
+            self.alive_ids = np.arange(len(brains))
+            self.alive_brain = self.population_brain
+        else:
+            self.ai_birds = [Bird(brain=brain, headless=True) for brain in brains]
+        self.clock.reset()
+        self.next_pipe = 0
+
+    def step(self):
+        """
+        Simulate a single frame
+
+        Returns:
+            int: Number of birds alive at the start of the frame
+        """
+        self.next_pipe = self.course.spawn_due(self.pipes, self.next_pipe, self.clock.frame)
+
+        with PROFILER.phase('pipes'):
+            self.pipes.update()
+        if self.vectorized:
+            alive_count = self.step_vectorized()
+        else:
+            alive_count = step_ai_birds(self.ai_birds, self.pipes)
+        self.clock.tick()
+        PROFILER.count('frames')
+        return alive_count
+
+    def step_vectorized(self):
+        """
+        Advance the array-backed population by one frame
+
+        Returns:
+            int: Number of birds alive at the start of the frame
+        """
+        sim = self.simulator
+        bounds = self.pipes.bounds()
+        with PROFILER.phase('think'):
+            obs = sim.observe(gap_features(bounds, sim.left))
+            alive = np.flatnonzero(sim.alive)
+            if len(alive) != len(self.alive_ids):
+                # Birds only ever die, so a different count means a different set
+                self.alive_ids = alive
+                self.alive_brain = self.population_brain.subset(alive)
+            jumps = np.zeros(sim.population_size, dtype=bool)
+            jumps[alive] = self.alive_brain.predict(obs[alive])
+        with PROFILER.phase('physics'):
+            return sim.step(jumps, bounds)
+
+    def fitness_scores(self):
+        """Fitness of every bird in the current generation"""
+        if self.vectorized:
+            return self.simulator.fitness.tolist()
+        return [bird.fitness for bird in self.ai_birds]
+
+    def simulate(self, course_seed=None, brains=None):
+        """
+        Simulate the current brains until every bird dies or time runs out
+
+        Args:
+            course_seed: Seed for the pipe heights of this episode
+            brains: Networks to fly instead of the whole population
+
+        Returns:
+            list: Fitness score of each bird
+        """
+        with PROFILER.phase('reset'):
+            self.reset_game(course_seed, brains)
+        while self.step() > 0 and self.clock.frame <= self.max_frames:
+            if self.frame_callback and self.frame_callback(self):
+                break
+        return self.fitness_scores()
+
+    def run_generation(self):
+        """
+        Simulate one generation on a fresh course (or several, see episodes)
+
+        Each bird's fitness depends only on its own brain and the course,
+        so splitting the population across workers gives the same result.
+
+        Returns:
+            list: Fitness score of each bird
+        """
+        if not self.ai_brains:
+            self.ai_brains = self.ga.create_population()
+        if self.episodes > 1:
+            # A tuple of seeds - one episode per course for every genome
+            if self.course_seed is None:
+                course_seed = tuple(self.rng.randrange(2 ** 32) for _ in range(self.episodes))
+            else:
+                course_seed = tuple(self.course_seed + k for k in range(self.episodes))
+        elif self.course_seed is None:
+            course_seed = self.rng.randrange(2 ** 32)
+        else:
+            course_seed = self.course_seed
+        self.last_course_seed = course_seed
+        if self.fitness_cache is None:
+            return self.evaluate(self.ai_brains, course_seed)
+        scores, self.cache_hits = self.fitness_cache.evaluate(self.ai_brains, course_seed, self.evaluate)
+        PROFILER.count('cache_hits', self.cache_hits)
+        return scores
+
+    def evaluate(self, brains, course_seed):
+        """
+        Fly a list of networks on one course, in worker processes if an evaluator is set
+
+        Args:
+            brains: List of NeuralNetwork instances
+            course_seed: Course seed, or a tuple of seeds to fly every network on each of them
+
+        Returns:
+            list: Fitness score of each network
+        """
+        if isinstance(course_seed, tuple):
+            if self.evaluator:
+                scores = self.evaluator.evaluate(brains, course_seed)
+            else:
+                scores = simulate_courses(brains, course_seed, self.max_frames)
+            return aggregate_fitness(scores, self.aggregate, self.quantile).tolist()
+        if self.evaluator:
+            return self.evaluator.evaluate(brains, course_seed).tolist()
+        return self.simulate(course_seed, brains)
+
+    def resume(self, path):
+        """
+        Continue training from a checkpoint
+
+        Args:
+            path: .npz file written by a CheckpointWriter
+        """
+        self.ai_brains = load_checkpoint(path, self.ga, self.rng)
+
+    def train(self, generations, callback=None, checkpointer=None, recorder=None):
+        """
+        Run the genetic algorithm for a number of generations
+
+        Args:
+            generations: Number of generations to simulate
+            callback: Optional function called with the stats dict of each generation
+            checkpointer: Optional CheckpointWriter saving progress every few generations
+            recorder: Optional ReplayRecorder storing a replay of every new record
+
+        Returns:
+            NeuralNetwork: Best brain found so far
+        """
+        for _ in range(generations):
+            fitness_scores = self.run_generation()
+            record = self.ga.best_fitness
+            self.ai_brains = self.ga.evolve(self.ai_brains, fitness_scores)
+            PROFILER.end_generation(self.ga.generation - 1)
+            if self.fitness_cache is not None:
+                self.ga.history[-1]['cache_hits'] = self.cache_hits
+            if callback:
+                callback(self.ga.history[-1])
+            if checkpointer:
+                checkpointer.maybe_save(self.ga, self.ai_brains, self.rng)
+            if recorder and self.ga.best_fitness > record:
+                # With several episodes per genome, the record is replayed on the first course
+                course_seed = self.last_course_seed
+                if isinstance(course_seed, tuple):
+                    course_seed = course_seed[0]
+                recorder.record(self.ga.best_brain, course_seed, self.ga.generation - 1, self.max_frames)
+        return self.ga.best_brain
@@ -0,0 +1,99 @@
+import numpy as np
+from src.settings import *
+from src.course import Course, course_length
+from src.pipe import PipeManager
+from src.population import PopulationSimulator
+from src.neural_network import PopulationBrain
+
+AGGREGATES = ['mean', 'min', 'quantile']
+
+
+def simulate_courses(population, course_seeds, max_frames=GENERATION_TIMEOUT_FRAMES):
+    """
+    Fly every network on every course in one batch
+
+    All courses spawn their pipes on the same frames and the pipes move at
+    the same speed, so pipe x positions are shared and only the gap heights
+    differ per course.  The population x courses birds are therefore stepped
+    as one PopulationSimulator against a single PipeManager, with a gap
+    height lookup per bird.
+
+    Args:
+        population: List of NeuralNetwork instances
+        course_seeds: Sequence of K course seeds
+        max_frames: Frames before an episode is cut off
+
+    Returns:
+        numpy array of shape (len(population), K) with the fitness of each episode
+    """
+    size, episodes = len(population), len(course_seeds)
+    length = course_length(max_frames)
+    courses = [Course(seed, length) for seed in course_seeds]
+    gap_tops = np.stack([course.gap_centers[:length] for course in courses]) - PIPE_GAP // 2
+    gap_bottoms = gap_tops + 2 * (PIPE_GAP // 2)
+
+    # Bird i flies network i // K on course i % K
+    genome = np.repeat(np.arange(size), episodes)
+    course_of = np.tile(np.arange(episodes), size)
+
+    sim = PopulationSimulator(size * episodes)
+    brain = PopulationBrain(population)
+    # Pipe x positions and spawn frames come from any one course - they are the same for all
+    pipes = PipeManager(headless=True)
+    jumps = np.zeros(sim.population_size, dtype=bool)
+    # One network per bird, regathered only when birds die
+    alive = np.arange(sim.population_size)
+    alive_brain = brain.subset(genome)
+    next_pipe = 0
+    frame = 0
+
+    while True:
+        next_pipe = courses[0].spawn_due(pipes, next_pipe, frame)
+        pipes.update()
+        bounds = pipes.bounds()
+
+        # Active pairs are the most recently spawned ones, oldest first
+        ids = np.arange(next_pipe - len(bounds), next_pipe)
+        tops = gap_tops[:, ids][course_of]
+        bottoms = gap_bottoms[:, ids][course_of]
+
+        ahead = np.flatnonzero(bounds[:, 1] > sim.left)
+        if len(ahead):
+            first = ahead[0]
+            gap = (bounds[first, 0] - sim.left, tops[:, first], bottoms[:, first])
+        else:
+            # No pipe ahead, use default values
+            gap = (SCREEN_WIDTH, 0, SCREEN_HEIGHT)
+
+        if np.count_nonzero(sim.alive) != len(alive):
+            alive = np.flatnonzero(sim.alive)
+            alive_brain = brain.subset(genome[alive])
+        jumps.fill(False)
+        jumps[alive] = alive_brain.predict(sim.observe(gap)[alive])
+        alive_count = sim.step(jumps, bounds, (tops, bottoms))
+        frame += 1
+        if alive_count == 0 or frame > max_frames:
+            break
+
+    return sim.fitness.reshape(size, episodes)
+
+
+def aggregate_fitness(scores, method='mean', quantile=0.25):
+    """
+    Combine the episode scores of each network into one fitness
+
+    Args:
+        scores: numpy array of shape (population_size, K)
+        method: 'mean', 'min' or 'quantile'
+        quantile: Quantile used by the 'quantile' method
+
+    Returns:
+        numpy array of shape (population_size,)
+    """
+    if method == 'mean':
+        return scores.mean(axis=1)
+    if method == 'min':
+        return scores.min(axis=1)
+    if method == 'quantile':
+        return np.quantile(scores, quantile, axis=1)
+    raise ValueError(f"Unknown fitness aggregate: {method}")
@@ -1,10 +1,55 @@
+import hashlib
 import numpy as np
-import random
+from src.crossover import crossover_population
+
+
+def layer_shapes(input_size=5, hidden_size=8, output_size=1):
+    """Shapes of the four parameter blocks, in the order they sit in the flat buffer"""
+    return [
+        ('weights_input_hidden', (input_size, hidden_size)),
+        ('bias_hidden', (1, hidden_size)),
+        ('weights_hidden_output', (hidden_size, output_size)),
+        ('bias_output', (1, output_size)),
+    ]
+
+
+def param_count(input_size=5, hidden_size=8, output_size=1):
+    """Total number of parameters of a network"""
+    return sum(int(np.prod(shape)) for _, shape in layer_shapes(input_size, hidden_size, output_size))
+
+
+class _ParamBlock:
+    """Attribute exposing a reshaped view of the flat parameter buffer
+
+    Assigning to it copies into the buffer instead of rebinding, so the
+    views always stay backed by ``params``.
+    """
+    
+    def __set_name__(self, owner, name):
+        self.view_name = '_' + name
+    
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return getattr(obj, self.view_name)
+    
+    def __set__(self, obj, value):
+        getattr(obj, self.view_name)[...] = value
+
 
 class NeuralNetwork:
-    """Simple feedforward neural network for the bird's brain"""
+    """Simple feedforward neural network for the bird's brain
     
-    def __init__(self, input_size=5, hidden_size=8, output_size=1):
+    All weights and biases live in one contiguous vector, ``params``;
+    the four matrices are reshaped views into it.
+    """
+    
+    weights_input_hidden = _ParamBlock()
+    bias_hidden = _ParamBlock()
+    weights_hidden_output = _ParamBlock()
+    bias_output = _ParamBlock()
+    
+    def __init__(self, input_size=5, hidden_size=8, output_size=1, params=None, dtype=np.float64):
         """
         Initialize neural network with random weights
         
@@ -17,17 +62,50 @@ class NeuralNetwork:
         
         Output:
         - Jump decision (sigmoid > 0.5 = jump)
+        
+        Args:
+            input_size, hidden_size, output_size: Layer sizes
+            params: Optional 1-D parameter buffer to use as-is (no copy, no random init),
+                e.g. a row of a population matrix
+            dtype: Buffer dtype when a new one is allocated (float32 or float64)
         """
         self.input_size = input_size
         self.hidden_size = hidden_size
         self.output_size = output_size
         
-        # Initialize weights with Xavier initialization
-        self.weights_input_hidden = np.random.randn(input_size, hidden_size) * np.sqrt(2.0 / input_size)
-        self.bias_hidden = np.zeros((1, hidden_size))
+        if params is not None:
+            if params.ndim != 1 or params.size != param_count(input_size, hidden_size, output_size):
+                raise ValueError("params does not match the network layer sizes")
+            self.params = params
+            self._bind_views()
+            return
         
+        self.params = np.zeros(param_count(input_size, hidden_size, output_size), dtype=dtype)
+        self._bind_views()
+        
+        # Initialize weights with Xavier initialization, biases stay zero
+        self.weights_input_hidden = np.random.randn(input_size, hidden_size) * np.sqrt(2.0 / input_size)
         self.weights_hidden_output = np.random.randn(hidden_size, output_size) * np.sqrt(2.0 / hidden_size)
-        self.bias_output = np.zeros((1, output_size))
+    
+    def _bind_views(self):
+        """Create the reshaped views of the parameter buffer"""
+        offset = 0
+        for name, shape in layer_shapes(self.input_size, self.hidden_size, self.output_size):
+            size = int(np.prod(shape))
+            setattr(self, '_' + name, self.params[offset:offset + size].reshape(shape))
+            offset += size
+    
+    def __getstate__(self):
+        """Pickle/deepcopy only the layer sizes and the flat buffer - the views are rebuilt"""
+        return {'input_size': self.input_size, 'hidden_size': self.hidden_size,
+                'output_size': self.output_size, 'params': self.params}
+    
+    def __setstate__(self, state):
+        self.input_size = state['input_size']
+        self.hidden_size = state['hidden_size']
+        self.output_size = state['output_size']
+        self.params = state['params']
+        self._bind_views()
     
     def sigmoid(self, x):
         """Sigmoid activation function"""
@@ -83,12 +161,8 @@ class NeuralNetwork:
     
     def copy(self):
         """Create a copy of this neural network"""
-        new_nn = NeuralNetwork(self.input_size, self.hidden_size, self.output_size)
-        new_nn.weights_input_hidden = self.weights_input_hidden.copy()
-        new_nn.bias_hidden = self.bias_hidden.copy()
-        new_nn.weights_hidden_output = self.weights_hidden_output.copy()
-        new_nn.bias_output = self.bias_output.copy()
-        return new_nn
+        return NeuralNetwork(self.input_size, self.hidden_size, self.output_size,
+                             params=self.params.copy())
     
     def mutate(self, mutation_rate=0.1, mutation_strength=0.5):
         """
@@ -98,46 +172,192 @@ class NeuralNetwork:
             mutation_rate: Probability of mutating each weight
             mutation_strength: Standard deviation of mutation
         """
-        # Mutate input to hidden weights
-        mask = np.random.random(self.weights_input_hidden.shape) < mutation_rate
-        self.weights_input_hidden += mask * np.random.randn(*self.weights_input_hidden.shape) * mutation_strength
-        
-        # Mutate hidden to output weights
-        mask = np.random.random(self.weights_hidden_output.shape) < mutation_rate
-        self.weights_hidden_output += mask * np.random.randn(*self.weights_hidden_output.shape) * mutation_strength
-        
-        # Mutate biases
-        mask = np.random.random(self.bias_hidden.shape) < mutation_rate
-        self.bias_hidden += mask * np.random.randn(*self.bias_hidden.shape) * mutation_strength
-        
-        mask = np.random.random(self.bias_output.shape) < mutation_rate
-        self.bias_output += mask * np.random.randn(*self.bias_output.shape) * mutation_strength
+        mask = np.random.random(self.params.shape) < mutation_rate
+        self.params += mask * np.random.randn(self.params.size) * mutation_strength
     
-    def crossover(self, other):
+    def crossover(self, other, method='uniform'):
         """
         Create a child network by crossing over with another network
         
         Args:
             other: Another NeuralNetwork instance
+            method: 'uniform', 'single_point', 'arithmetic' or 'sbx'
         
         Returns:
             NeuralNetwork: Child network
         """
-        child = NeuralNetwork(self.input_size, self.hidden_size, self.output_size)
+        child = crossover_population(self.params[None, :], other.params[None, :], method)
+        return NeuralNetwork(self.input_size, self.hidden_size, self.output_size, params=child[0])
+    
+    def genome_hash(self):
+        """
+        Hash of the layer sizes and parameters
         
-        # Crossover weights - random blend
-        for i in range(self.weights_input_hidden.shape[0]):
-            for j in range(self.weights_input_hidden.shape[1]):
-                if random.random() < 0.5:
-                    child.weights_input_hidden[i][j] = self.weights_input_hidden[i][j]
-                else:
-                    child.weights_input_hidden[i][j] = other.weights_input_hidden[i][j]
+        Returns:
+            str: Hex digest, equal for networks with identical weights
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(np.array([self.input_size, self.hidden_size, self.output_size], dtype=np.int64).tobytes())
+        digest.update(self.params.dtype.str.encode())
+        digest.update(np.ascontiguousarray(self.params).tobytes())
+        return digest.hexdigest()
+    
+    def to_bytes(self):
+        """Serialise the parameters as raw bytes"""
+        return np.ascontiguousarray(self.params).tobytes()
+    
+    @classmethod
+    def from_bytes(cls, data, input_size=5, hidden_size=8, output_size=1, dtype=np.float64):
+        """
+        Rebuild a network from to_bytes output
         
-        for i in range(self.weights_hidden_output.shape[0]):
-            for j in range(self.weights_hidden_output.shape[1]):
-                if random.random() < 0.5:
-                    child.weights_hidden_output[i][j] = self.weights_hidden_output[i][j]
-                else:
-                    child.weights_hidden_output[i][j] = other.weights_hidden_output[i][j]
+        Returns:
+            NeuralNetwork: Network owning a copy of the parameters
+        """
+        params = np.frombuffer(data, dtype=dtype).copy()
+        return cls(input_size, hidden_size, output_size, params=params)
+
+
+def population_matrix(networks):
+    """
+    Store a whole population as one 2-D array
+    
+    Args:
+        networks: List of NeuralNetwork instances with identical layer sizes
+    
+    Returns:
+        numpy array of shape (len(networks), param_count)
+    """
+    return np.stack([nn.params for nn in networks])
+
+
+def networks_from_matrix(matrix, input_size=5, hidden_size=8, output_size=1):
+    """
+    Wrap every row of a population matrix in a NeuralNetwork
+    
+    The networks are zero-copy views: changing a network changes the matrix.
+    
+    Args:
+        matrix: numpy array of shape (population_size, param_count)
+    
+    Returns:
+        list: NeuralNetwork instances backed by the rows of matrix
+    """
+    return [NeuralNetwork(input_size, hidden_size, output_size, params=row) for row in matrix]
+
+class PopulationBrain:
+    """Every network of a population stacked into 3-D tensors for batched inference"""
+    
+    def __init__(self, networks):
+        """
+        Stack the weights of a list of networks
         
-        return child
+        Args:
+            networks: List of NeuralNetwork instances with identical layer sizes
+        """
+        first = networks[0]
+        self._bind_matrix(population_matrix(networks), first.input_size, first.hidden_size, first.output_size)
+    
+    @classmethod
+    def from_matrix(cls, matrix, input_size=5, hidden_size=8, output_size=1):
+        """
+        Use a population matrix directly, without copying it
+        
+        Args:
+            matrix: numpy array of shape (population_size, param_count)
+        
+        Returns:
+            PopulationBrain: Brain whose tensors are views of matrix
+        """
+        brain = cls.__new__(cls)
+        brain._bind_matrix(matrix, input_size, hidden_size, output_size)
+        return brain
+    
+    def _bind_matrix(self, matrix, input_size, hidden_size, output_size):
+        """Expose the matrix columns as (population_size, rows, cols) tensors"""
+        self.matrix = matrix
+        self.layer_sizes = (input_size, hidden_size, output_size)
+        self.size = len(matrix)
+        offset = 0
+        for name, shape in layer_shapes(input_size, hidden_size, output_size):
+            size = int(np.prod(shape))
+            setattr(self, name, matrix[:, offset:offset + size].reshape((self.size,) + shape))
+            offset += size
+    
+    def subset(self, indices):
+        """
+        Brain over some of the networks, e.g. the birds still alive
+        
+        The weights are gathered once here, so the subset can then run
+        forward without indices every frame until the selection changes.
+        
+        Args:
+            indices: Array of network indices to keep
+        
+        Returns:
+            PopulationBrain: Brain over a copy of the selected rows
+        """
+        return PopulationBrain.from_matrix(self.matrix[indices], *self.layer_sizes)
+    
+    def forward(self, inputs, indices=None):
+        """
+        Forward propagation for many networks at once
+        
+        Matches NeuralNetwork.forward bit for bit: each network still
+        multiplies a (1, input_size) row by its own weight matrix.  A brain
+        of a single network broadcasts it over all rows.
+        
+        Args:
+            inputs: numpy array of shape (n, input_size), one row per network
+            indices: Optional array of network indices the rows belong to -
+                this gathers all four weight tensors, so per-frame loops
+                should keep a subset() brain instead
+        
+        Returns:
+            numpy array of shape (n,) with decision values (0-1)
+        """
+        if indices is None:
+            w1, b1 = self.weights_input_hidden, self.bias_hidden
+            w2, b2 = self.weights_hidden_output, self.bias_output
+        else:
+            w1, b1 = self.weights_input_hidden[indices], self.bias_hidden[indices]
+            w2, b2 = self.weights_hidden_output[indices], self.bias_output[indices]
+        
+        hidden = np.maximum(0, np.matmul(inputs[:, None, :], w1) + b1)
+        output = 1 / (1 + np.exp(-np.clip(np.matmul(hidden, w2) + b2, -500, 500)))
+        return output[:, 0, 0]
+    
+    def predict(self, observations, indices=None):
+        """
+        Decide whether each bird should jump
+        
+        Args:
+            observations: numpy array of shape (n, 5) with the raw inputs of
+                NeuralNetwork.predict (bird y, velocity, pipe x, pipe top y, pipe bottom y)
+            indices: Optional array of network indices the rows belong to
+        
+        Returns:
+            numpy array of shape (n,), True where the bird should jump
+        """
+        return self.forward(normalize_inputs(observations), indices) > 0.5
+
+
+def normalize_inputs(observations, out=None):
+    """
+    Scale raw observations the same way NeuralNetwork.predict does
+    
+    Args:
+        observations: numpy array of shape (n, 5)
+        out: Optional float64 array of the same shape to write into
+    
+    Returns:
+        numpy array of shape (n, 5)
+    """
+    inputs = np.empty(observations.shape, dtype=np.float64) if out is None else out
+    np.divide(observations[:, 0], 512.0, out=inputs[:, 0])
+    np.add(observations[:, 1], 10, out=inputs[:, 1])
+    np.divide(inputs[:, 1], 20.0, out=inputs[:, 1])
+    np.divide(observations[:, 2], 288.0, out=inputs[:, 2])
+    np.divide(observations[:, 3], 512.0, out=inputs[:, 3])
+    np.divide(observations[:, 4], 512.0, out=inputs[:, 4])
+    return inputs
@@ -0,0 +1,50 @@
+import numpy as np
+from src.settings import *
+
+
+def gap_features(bounds, bird_left):
+    """
+    Pipe part of the neural network inputs
+
+    Pairs are ordered oldest (leftmost) first, so the first one whose right
+    edge is past the bird is the nearest gap ahead.
+
+    Args:
+        bounds: Pipe pair geometry from PipeManager.bounds()
+        bird_left: Left edge of the bird
+
+    Returns:
+        tuple: (pipe_x, pipe_top_y, pipe_bottom_y)
+    """
+    for left, right, gap_top, gap_bottom in bounds.tolist():
+        if right > bird_left:
+            return left - bird_left, gap_top, gap_bottom
+    # No pipe ahead, use default values
+    return SCREEN_WIDTH, 0, SCREEN_HEIGHT
+
+
+def build_observations(bounds, birds):
+    """
+    Build the 5 raw inputs of NeuralNetwork.predict for every bird at once
+
+    The next gap is looked up once per distinct bird x position (all birds
+    normally share one), not once per bird.
+
+    Args:
+        bounds: Pipe pair geometry from PipeManager.bounds()
+        birds: List of Bird instances
+
+    Returns:
+        numpy array of shape (len(birds), 5): bird y, velocity, pipe x,
+        pipe top y, pipe bottom y
+    """
+    observations = np.empty((len(birds), 5), dtype=np.float64)
+    gaps = {}
+    for i, bird in enumerate(birds):
+        left = bird.rect.left
+        if left not in gaps:
+            gaps[left] = gap_features(bounds, left)
+        observations[i, 0] = bird.rect.centery
+        observations[i, 1] = bird.velocity
+        observations[i, 2:] = gaps[left]
+    return observations
@@ -0,0 +1,88 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from src.settings import GENERATION_TIMEOUT_FRAMES
+from src.neural_network import population_matrix, networks_from_matrix
+
+
+def _evaluate_chunk(payload):
+    """
+    Worker entry point - run one headless episode for a slice of the population
+
+    Args:
+        payload: Tuple of (genome bytes, shape, dtype, layer sizes, course seed, max frames)
+
+    Returns:
+        numpy array of fitness scores for the slice, one column per course
+        if a tuple of course seeds was sent
+    """
+    # Imported here so the parent does not pay for it when spawning workers
+    from src.headless import HeadlessGame
+    from src.multi_course import simulate_courses
+
+    data, shape, dtype, sizes, course_seed, max_frames = payload
+    matrix = np.frombuffer(data, dtype=dtype).reshape(shape)
+    networks = networks_from_matrix(matrix, *sizes)
+    if isinstance(course_seed, tuple):
+        return simulate_courses(networks, course_seed, max_frames)
+    game = HeadlessGame(max_frames=max_frames, vectorized=True)
+    game.ai_brains = networks
+    return np.asarray(game.simulate(course_seed))
+
+
+class ParallelEvaluator:
+    """Evaluates a population across a pool of worker processes"""
+
+    def __init__(self, workers=None, chunk_size=None, max_frames=GENERATION_TIMEOUT_FRAMES):
+        """
+        Initialize evaluator
+
+        Args:
+            workers: Number of worker processes (defaults to the CPU count)
+            chunk_size: Birds per task (defaults to an even split across workers)
+            max_frames: Frames before an episode is cut off
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.max_frames = max_frames
+        self.pool = None
+
+    def evaluate(self, population, course_seed):
+        """
+        Run every network in the population on the same course
+
+        Args:
+            population: List of NeuralNetwork instances
+            course_seed: Seed for the pipe heights of the episode, or a tuple of seeds
+
+        Returns:
+            numpy array of fitness scores, in population order (shape (n, K) for K seeds)
+        """
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(max_workers=self.workers)
+
+        first = population[0]
+        sizes = (first.input_size, first.hidden_size, first.output_size)
+        matrix = population_matrix(population)
+        chunk_size = self.chunk_size or -(-len(matrix) // self.workers)
+
+        # Genomes travel as raw parameter bytes, not pickled networks
+        payloads = []
+        for start in range(0, len(matrix), chunk_size):
+            chunk = matrix[start:start + chunk_size]
+            payloads.append((chunk.tobytes(), chunk.shape, chunk.dtype.str, sizes,
+                             course_seed, self.max_frames))
+
+        return np.concatenate(list(self.pool.map(_evaluate_chunk, payloads)))
+
+    def close(self):
+        """Shut down the worker processes"""
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -1,26 +1,162 @@
 import pygame
-import random
+import numpy as np
 from src.settings import *
 
 class Pipe(pygame.sprite.Sprite):
-    def __init__(self, x, y, position):
+    def __init__(self, x, y, position, headless=None):
         super().__init__()
-        self.image = load_image('pipe-red.png')
+        if headless is None:
+            headless = ASSETS.headless
+        if headless:
+            # Physics only - no surfaces, just the collision rect
+            self.image = None
+            self.rect = pygame.Rect((0, 0), PIPE_SIZE)
+            if position == 1:
+                self.rect.bottomleft = (x, y - PIPE_GAP // 2)
+            else:
+                self.rect.topleft = (x, y + PIPE_GAP // 2)
+            return
+
+        # position 1 is from top, -1 is from bottom
+        self.image = ASSETS.get('pipe-red.png', scale2x=True, flip=position == 1)
         
-        if self.image:
-            self.image = pygame.transform.scale2x(self.image)
-        else:
+        if not self.image:
             self.image = pygame.Surface((52, 320))
             self.image.fill((0, 255, 0))
+            if position == 1:
+                self.image = pygame.transform.flip(self.image, False, True)
 
-        # position 1 is from top, -1 is from bottom
         if position == 1:
-            self.image = pygame.transform.flip(self.image, False, True)
             self.rect = self.image.get_rect(bottomleft=(x, y - PIPE_GAP // 2))
         else:
             self.rect = self.image.get_rect(topleft=(x, y + PIPE_GAP // 2))
 
+
+class PipePair:
+    """Top and bottom pipe around one gap, with the gap edges kept explicitly"""
+    
+    def __init__(self, x, gap_center, headless=None):
+        """
+        Args:
+            x: Left edge of both pipes
+            gap_center: Y coordinate of the middle of the gap
+            headless: Skip surfaces (defaults to ASSETS.headless)
+        """
+        self.bottom_pipe = Pipe(x, gap_center, -1, headless)
+        self.top_pipe = Pipe(x, gap_center, 1, headless)
+        self.move_to(x, gap_center)
+    
+    def move_to(self, x, gap_center):
+        """Reposition both pipes around a new gap (used when recycling)"""
+        self.gap_center = gap_center
+        self.gap_top = gap_center - PIPE_GAP // 2
+        self.gap_bottom = gap_center + PIPE_GAP // 2
+        self.top_pipe.rect.bottomleft = (x, self.gap_top)
+        self.bottom_pipe.rect.topleft = (x, self.gap_bottom)
+    
+    def set_x(self, x):
+        self.top_pipe.rect.x = x
+        self.bottom_pipe.rect.x = x
+    
+    @property
+    def left(self):
+        return self.bottom_pipe.rect.left
+    
+    @property
+    def right(self):
+        return self.bottom_pipe.rect.right
+    
+    @property
+    def sprites(self):
+        return (self.bottom_pipe, self.top_pipe)
+
+
+class PipeManager:
+    """Fixed-capacity ring buffer of recycled pipe pairs
+    
+    PipePair objects are created once and repositioned when they scroll
+    off-screen instead of being killed and rebuilt. Pair x positions and
+    gap centers are mirrored in small arrays so collision and observation
+    code can read them without touching sprites.
+    """
+    
+    def __init__(self, capacity=PIPE_POOL_SIZE, headless=None):
+        """
+        Args:
+            capacity: Maximum number of pairs on screen at once
+            headless: Skip surfaces (defaults to ASSETS.headless)
+        """
+        self.capacity = capacity
+        self.pool = [PipePair(SCREEN_WIDTH, SCREEN_HEIGHT // 2, headless) for _ in range(capacity)]
+        self.width = self.pool[0].bottom_pipe.rect.width
+        self.x = np.zeros(capacity, dtype=np.int64)
+        self.gap_center = np.zeros(capacity, dtype=np.int64)
+        self.head = 0
+        self.count = 0
+        
+        # Active sprites only, for drawing and sprite collision
+        self.group = pygame.sprite.Group()
+    
+    def __len__(self):
+        return self.count
+    
+    def __iter__(self):
+        """Active pairs, oldest (leftmost) first"""
+        for i in range(self.count):
+            yield self.pool[(self.head + i) % self.capacity]
+    
+    def first(self):
+        """Oldest active pair, or None"""
+        return self.pool[self.head] if self.count else None
+    
+    def clear(self):
+        self.group.empty()
+        self.head = 0
+        self.count = 0
+    
+    def spawn(self, gap_center, x=SCREEN_WIDTH):
+        """
+        Activate a pair from the pool at the right edge of the screen
+        
+        Args:
+            gap_center: Y coordinate of the middle of the gap
+            x: Left edge of the new pair
+        """
+        if self.count == self.capacity:
+            # Pool exhausted - recycle the oldest pair early
+            self._release_oldest()
+        slot = (self.head + self.count) % self.capacity
+        self.x[slot] = x
+        self.gap_center[slot] = gap_center
+        pair = self.pool[slot]
+        pair.move_to(x, gap_center)
+        self.group.add(*pair.sprites)
+        self.count += 1
+    
     def update(self):
-        self.rect.x -= PIPE_SPEED
-        if self.rect.right < 0:
-            self.kill()
+        """Scroll every active pair and recycle the ones that left the screen"""
+        for i in range(self.count):
+            slot = (self.head + i) % self.capacity
+            self.x[slot] -= PIPE_SPEED
+            self.pool[slot].set_x(self.x[slot])
+        while self.count and self.x[self.head] + self.width < 0:
+            self._release_oldest()
+    
+    def _release_oldest(self):
+        for sprite in self.pool[self.head].sprites:
+            self.group.remove(sprite)
+        self.head = (self.head + 1) % self.capacity
+        self.count -= 1
+    
+    def bounds(self):
+        """
+        Geometry of the active pairs, oldest first
+        
+        Returns:
+            numpy array of shape (count, 4) holding left, right, gap top, gap bottom
+        """
+        slots = (self.head + np.arange(self.count)) % self.capacity
+        left = self.x[slots]
+        center = self.gap_center[slots]
+        return np.stack([left, left + self.width,
+                         center - PIPE_GAP // 2, center + PIPE_GAP // 2], axis=1)
@@ -0,0 +1,384 @@
+import time
+import numpy as np
+from src.settings import *
+from src.neural_network import NeuralNetwork, PopulationBrain, normalize_inputs
+from src.vec_env import VecEnv
+
+POLICY_FORMATS = ['float64', 'float16', 'int8', 'table']
+
+# Range of each raw input of NeuralNetwork.predict seen in play: bird centre y,
+# velocity, distance to the next pipe, gap top and gap bottom (Course draws gap
+# centres within 100 px of the middle of the screen)
+OBSERVATION_RANGES = (
+    (0, GROUND_Y),
+    (BIRD_JUMP, BIRD_MAX_VELOCITY),
+    (-PIPE_SIZE[0], SCREEN_WIDTH),
+    (SCREEN_HEIGHT // 2 - 100 - PIPE_GAP // 2, SCREEN_HEIGHT // 2 + 100 - PIPE_GAP // 2),
+    (SCREEN_HEIGHT // 2 - 100 + PIPE_GAP // 2, SCREEN_HEIGHT // 2 + 100 + PIPE_GAP // 2),
+)
+TABLE_BINS = (32, 16, 32, 16, 16)
+
+
+def input_scaling(input_size=5):
+    """
+    The input normalisation as an affine map
+
+    Returns:
+        tuple: (scale, offset) with normalize_inputs(x) == x * scale + offset
+    """
+    offset = normalize_inputs(np.zeros((1, input_size)))[0]
+    return normalize_inputs(np.ones((1, input_size)))[0] - offset, offset
+
+
+def fold_normalization(network):
+    """
+    Turn a network into plain matrices acting on raw observations
+
+    The input scaling of NeuralNetwork.predict is affine, so it is folded
+    into the first layer; and since sigmoid(z) > 0.5 exactly when z > 0,
+    the decision only needs the sign of the output pre-activation.
+
+    Args:
+        network: NeuralNetwork with a single output
+
+    Returns:
+        tuple: (w1, b1, w2, b2) float64 arrays; jump where relu(x @ w1 + b1) @ w2 + b2 > 0
+    """
+    scale, offset = input_scaling(network.input_size)
+    w1 = network.weights_input_hidden * scale[:, None]
+    b1 = network.bias_hidden[0] + offset @ network.weights_input_hidden
+    return w1, b1, network.weights_hidden_output[:, 0], float(network.bias_output[0, 0])
+
+
+def _quantize_int8(weights):
+    """Symmetric int8 quantisation with one scale per output column"""
+    scale = np.abs(weights).max(axis=0) / 127.0
+    scale[scale == 0] = 1.0
+    return np.round(weights / scale).astype(np.int8), scale.astype(np.float32)
+
+
+class QuantizedNetwork:
+    """A trained network stored in int8 or float16 for cheap inference
+
+    Input scaling is folded into the first layer and the output sigmoid is
+    dropped (see fold_normalization). int8 weights carry one float32 scale
+    per neuron and biases stay float32; the first layer is quantised before
+    the input scaling is folded in, since the raw inputs differ in range by
+    orders of magnitude and would otherwise share one coarse scale.
+
+    NumPy has no faster int8 or float16 matrix product at this size, so the
+    weights are expanded to float32 once on load; the win is fewer
+    operations per decision. The stored parameters are about 4x (int8) or
+    2x (float16) smaller than float64, but at this network size the .npz
+    file is dominated by per-array overhead and is not smaller on disk.
+    """
+
+    def __init__(self, precision, w1, b1, w2, b2, w1_scale=None, w2_scale=None, input_scale=None):
+        """
+        Use already quantised parameters - see from_network
+
+        Args:
+            precision: 'int8' or 'float16'
+            w1, b1, w2, b2: Folded parameters in the stored precision (biases float32 for int8)
+            w1_scale, w2_scale: Per-neuron scales of the int8 weights
+            input_scale: Input normalisation factors still to be folded into the int8 first layer
+        """
+        if precision not in ('int8', 'float16'):
+            raise ValueError(f"Unknown precision: {precision}")
+        self.precision = precision
+        self.stored = {'w1': w1, 'b1': b1, 'w2': w2, 'b2': b2}
+        if precision == 'int8':
+            self.stored.update(w1_scale=w1_scale, w2_scale=w2_scale, input_scale=input_scale)
+            self.w1 = w1.astype(np.float32) * w1_scale * input_scale[:, None]
+            self.w2 = w2.astype(np.float32) * w2_scale
+        else:
+            self.w1 = w1.astype(np.float32)
+            self.w2 = w2.astype(np.float32)
+        self.b1 = np.asarray(b1, dtype=np.float32)
+        self.b2 = np.float32(b2)
+
+    @classmethod
+    def from_network(cls, network, precision='int8'):
+        """
+        Quantise a trained network
+
+        Args:
+            network: NeuralNetwork to compile
+            precision: 'int8' or 'float16'
+
+        Returns:
+            QuantizedNetwork
+        """
+        w1, b1, w2, b2 = fold_normalization(network)
+        if precision == 'int8':
+            q1, s1 = _quantize_int8(network.weights_input_hidden)
+            q2, s2 = _quantize_int8(w2[:, None])
+            input_scale = input_scaling(network.input_size)[0].astype(np.float32)
+            return cls(precision, q1, b1.astype(np.float32), q2[:, 0], np.float32(b2), s1, s2[0], input_scale)
+        return cls(precision, w1.astype(np.float16), b1.astype(np.float16),
+                   w2.astype(np.float16), np.float16(b2))
+
+    @property
+    def nbytes(self):
+        """Size of the stored parameters"""
+        return sum(np.asarray(value).nbytes for value in self.stored.values())
+
+    def predict(self, bird_y, bird_velocity, pipe_x, pipe_top_y, pipe_bottom_y):
+        """Same interface and meaning as NeuralNetwork.predict"""
+        inputs = np.array((bird_y, bird_velocity, pipe_x, pipe_top_y, pipe_bottom_y), dtype=np.float32)
+        hidden = np.maximum(inputs @ self.w1 + self.b1, 0)
+        return bool(hidden @ self.w2 + self.b2 > 0)
+
+    def predict_batch(self, observations):
+        """
+        Decide for many birds at once
+
+        Args:
+            observations: numpy array of shape (n, 5) with raw inputs
+
+        Returns:
+            numpy array of shape (n,), True where the bird should jump
+        """
+        hidden = np.maximum(observations.astype(np.float32) @ self.w1 + self.b1, 0)
+        return hidden @ self.w2 + self.b2 > 0
+
+    def to_arrays(self):
+        return {'format': np.array(self.precision), **self.stored}
+
+    @classmethod
+    def from_arrays(cls, data):
+        scales = ((data['w1_scale'], data['w2_scale'], data['input_scale']) if 'w1_scale' in data
+                  else (None, None, None))
+        return cls(str(data['format']), data['w1'], data['b1'], data['w2'], data['b2'][()], *scales)
+
+
+class LookupTablePolicy:
+    """The decisions of a network precomputed on a grid over the observation space
+
+    Every input is cut into uniform bins over OBSERVATION_RANGES (values
+    outside are clamped to the edge bins) and the table holds the network's
+    decision at the centre of every cell. A decision is then five bin
+    indices and one byte lookup, with no arithmetic on weights at all.
+    """
+
+    def __init__(self, table, ranges=OBSERVATION_RANGES):
+        """
+        Args:
+            table: Boolean array with one axis per input
+            ranges: (low, high) of every input
+        """
+        self.table = np.asarray(table, dtype=bool)
+        self.bins = self.table.shape
+        self.ranges = tuple((float(low), float(high)) for low, high in ranges)
+        self.low = np.array([low for low, _ in self.ranges])
+        self.inv_width = np.array([bins / (high - low) for bins, (low, high) in zip(self.bins, self.ranges)])
+        self.strides = np.array([stride // self.table.itemsize for stride in self.table.strides])
+        # Plain Python values for the per-bird path, where NumPy call overhead would dominate
+        self._flat = bytes(np.ascontiguousarray(self.table).view(np.uint8).ravel())
+        self._axes = [(low, inv, bins - 1, int(stride))
+                      for low, inv, bins, stride in zip(self.low.tolist(), self.inv_width.tolist(),
+                                                        self.bins, self.strides)]
+
+    @classmethod
+    def from_network(cls, network, bins=TABLE_BINS, ranges=OBSERVATION_RANGES, chunk=1 << 18):
+        """
+        Evaluate a network at the centre of every grid cell
+
+        Args:
+            network: NeuralNetwork to compile
+            bins: Number of bins per input
+            ranges: (low, high) of every input
+            chunk: Cells evaluated per batch
+
+        Returns:
+            LookupTablePolicy
+        """
+        bins = tuple(bins)
+        low = np.array([low for low, _ in ranges], dtype=np.float64)
+        width = np.array([(high - low) / count for count, (low, high) in zip(bins, ranges)])
+        brain = PopulationBrain([network])
+        cells = int(np.prod(bins))
+        table = np.empty(cells, dtype=bool)
+        for start in range(0, cells, chunk):
+            index = np.arange(start, min(start + chunk, cells))
+            centers = low + (np.stack(np.unravel_index(index, bins), axis=1) + 0.5) * width
+            table[index] = brain.predict(centers)
+        return cls(table.reshape(bins), ranges)
+
+    @property
+    def nbytes(self):
+        """Size of the table stored one bit per cell"""
+        return -(-self.table.size // 8)
+
+    def predict(self, bird_y, bird_velocity, pipe_x, pipe_top_y, pipe_bottom_y):
+        """Same interface and meaning as NeuralNetwork.predict"""
+        cell = 0
+        for value, (low, inv, last, stride) in zip((bird_y, bird_velocity, pipe_x, pipe_top_y, pipe_bottom_y),
+                                                   self._axes):
+            index = int((value - low) * inv)
+            cell += stride * (0 if index < 0 else last if index > last else index)
+        return self._flat[cell] != 0
+
+    def predict_batch(self, observations):
+        """
+        Decide for many birds at once
+
+        Args:
+            observations: numpy array of shape (n, 5) with raw inputs
+
+        Returns:
+            numpy array of shape (n,), True where the bird should jump
+        """
+        index = np.floor((observations - self.low) * self.inv_width).astype(np.intp)
+        np.clip(index, 0, np.array(self.bins) - 1, out=index)
+        return self.table.reshape(-1)[index @ self.strides]
+
+    def to_arrays(self):
+        return {'format': np.array('table'), 'bins': np.array(self.bins),
+                'ranges': np.array(self.ranges), 'table': np.packbits(self.table)}
+
+    @classmethod
+    def from_arrays(cls, data):
+        bins = tuple(int(x) for x in data['bins'])
+        table = np.unpackbits(data['table'], count=int(np.prod(bins))).astype(bool).reshape(bins)
+        return cls(table, data['ranges'])
+
+
+def compile_policy(network, policy_format, bins=TABLE_BINS):
+    """
+    Build one inference form of a trained network
+
+    Args:
+        network: NeuralNetwork to compile
+        policy_format: One of POLICY_FORMATS ('float64' returns a copy of the network)
+        bins: Bins per input for the 'table' format
+
+    Returns:
+        Object with the predict(...) interface of NeuralNetwork and a predict_batch(observations)
+    """
+    if policy_format == 'float64':
+        return network.copy()
+    if policy_format in ('int8', 'float16'):
+        return QuantizedNetwork.from_network(network, policy_format)
+    if policy_format == 'table':
+        return LookupTablePolicy.from_network(network, bins)
+    raise ValueError(f"Unknown policy format: {policy_format}")
+
+
+def save_policy(path, policy):
+    """Write a NeuralNetwork, QuantizedNetwork or LookupTablePolicy to an .npz file"""
+    if isinstance(policy, NeuralNetwork):
+        arrays = {'format': np.array('float64'), 'params': policy.params,
+                  'layer_sizes': np.array([policy.input_size, policy.hidden_size, policy.output_size])}
+    else:
+        arrays = policy.to_arrays()
+    np.savez_compressed(path, **arrays)
+
+
+def load_policy(path):
+    """
+    Read a policy written by save_policy
+
+    Every form can be given to Bird(brain=...) directly.
+
+    Returns:
+        NeuralNetwork, QuantizedNetwork or LookupTablePolicy
+    """
+    with np.load(path) as data:
+        data = dict(data)
+    policy_format = str(data['format'])
+    if policy_format == 'float64':
+        return NeuralNetwork(*(int(x) for x in data['layer_sizes']), params=data['params'])
+    if policy_format in ('int8', 'float16'):
+        return QuantizedNetwork.from_arrays(data)
+    if policy_format == 'table':
+        return LookupTablePolicy.from_arrays(data)
+    raise ValueError(f"{path} holds an unknown policy format: {policy_format}")
+
+
+def policy_decisions(policy, observations):
+    """Decisions of any policy form for a batch of raw observations"""
+    if isinstance(policy, NeuralNetwork):
+        # Row by row like NeuralNetwork.predict, so these are the reference decisions
+        return PopulationBrain([policy]).predict(observations)
+    return policy.predict_batch(observations)
+
+
+def fly_policy(policy, course_seeds, max_frames=GENERATION_TIMEOUT_FRAMES, collect=False):
+    """
+    Fly one policy on every course at once through VecEnv
+
+    Args:
+        policy: Any policy form
+        course_seeds: Sequence of course seeds, one episode each
+        max_frames: Frame limit of an episode
+        collect: Also return every observation the birds saw
+
+    Returns:
+        numpy array of episode fitness, plus an (n, 5) observation array if collect is set
+    """
+    env = VecEnv(len(course_seeds), max_frames=max_frames)
+    observations = env.reset(course_seeds)
+    running = np.ones(len(course_seeds), dtype=bool)
+    fitness = np.zeros(len(course_seeds))
+    seen = []
+    while running.any():
+        if collect:
+            seen.append(observations[running])
+        _, _, done = env.step(policy_decisions(policy, observations))
+        finished = done & running
+        fitness[finished] = env.final_return[finished]
+        running &= ~done
+    if collect:
+        return fitness, np.concatenate(seen)
+    return fitness
+
+
+def _time_predict(policy, observations, calls=2000):
+    """Mean seconds per single-bird predict call"""
+    rows = [tuple(row) for row in observations[:calls].tolist()]
+    start = time.perf_counter()
+    for row in rows:
+        policy.predict(*row)
+    return (time.perf_counter() - start) / len(rows)
+
+
+def accuracy_report(network, policies, course_seeds, max_frames=GENERATION_TIMEOUT_FRAMES, samples=100000,
+                    seed=0):
+    """
+    Compare compiled policies with the float64 network they came from
+
+    Args:
+        network: Original NeuralNetwork
+        policies: Dict of name -> compiled policy
+        course_seeds: Courses the policies are flown on
+        max_frames: Frame limit of an episode
+        samples: Uniformly drawn observations for the off-trajectory agreement
+        seed: Seed of the uniform observations
+
+    Returns:
+        dict: name -> {'trajectory_agreement', 'uniform_agreement', 'fitness', 'fitness_delta',
+                       'bytes', 'predict_us'} with the original network under 'float64'
+    """
+    reference_fitness, trajectory = fly_policy(network, course_seeds, max_frames, collect=True)
+    rng = np.random.default_rng(seed)
+    uniform = np.column_stack([rng.uniform(low, high, samples) for low, high in OBSERVATION_RANGES])
+    # Keep the gap height consistent like in play
+    uniform[:, 4] = uniform[:, 3] + 2 * (PIPE_GAP // 2)
+    expected = policy_decisions(network, trajectory)
+    expected_uniform = policy_decisions(network, uniform)
+
+    timing_rows = trajectory[rng.permutation(len(trajectory))]
+    report = {}
+    for name, policy in {'float64': network, **policies}.items():
+        fitness = reference_fitness if policy is network else fly_policy(policy, course_seeds, max_frames)
+        report[name] = {
+            'trajectory_agreement': float(np.mean(policy_decisions(policy, trajectory) == expected)),
+            'uniform_agreement': float(np.mean(policy_decisions(policy, uniform) == expected_uniform)),
+            'fitness': float(fitness.mean()),
+            'fitness_delta': float(fitness.mean() - reference_fitness.mean()),
+            'bytes': policy.params.nbytes if isinstance(policy, NeuralNetwork) else policy.nbytes,
+            'predict_us': _time_predict(policy, timing_rows) * 1e6,
+        }
+    return report
+
@@ -0,0 +1,114 @@
+import numpy as np
+from src.settings import *
+
+
+class PopulationSimulator:
+    """Steps a whole population of birds at once using NumPy arrays
+
+    Mirrors Bird.update, Bird.think and the collision/fitness rules of
+    step_ai_birds exactly, but keeps every bird's state in contiguous
+    arrays instead of one sprite per bird.
+    """
+
+    def __init__(self, population_size, ground_y=GROUND_Y):
+        """
+        Initialize simulator state
+
+        Args:
+            population_size: Number of birds
+            ground_y: Y coordinate of the ground
+        """
+        self.population_size = population_size
+        self.ground_y = ground_y
+
+        # Every bird shares the same x position and size
+        self.width, self.height = BIRD_SIZE
+        self.left = BIRD_START_POS[0] - self.width // 2
+        self.right = self.left + self.width
+        self.start_top = BIRD_START_POS[1] - self.height // 2
+
+        self.top = np.empty(population_size, dtype=np.int64)
+        self.velocity = np.empty(population_size, dtype=np.float64)
+        self.alive = np.empty(population_size, dtype=bool)
+        self.fitness = np.empty(population_size, dtype=np.float64)
+        self.reset()
+
+    def reset(self):
+        """Put every bird back at the start position"""
+        self.top.fill(self.start_top)
+        self.velocity.fill(0.0)
+        self.alive.fill(True)
+        self.fitness.fill(0.0)
+
+    @property
+    def centery(self):
+        return self.top + self.height // 2
+
+    def observe(self, gap):
+        """
+        Build the raw inputs of Bird.think for every bird
+
+        Args:
+            gap: (pipe_x, pipe_top_y, pipe_bottom_y) from observation.gap_features;
+                each entry is a scalar shared by all birds or an array with one value per bird
+
+        Returns:
+            numpy array of shape (population_size, 5)
+        """
+        obs = np.empty((self.population_size, 5), dtype=np.float64)
+        obs[:, 0] = self.centery
+        obs[:, 1] = self.velocity
+        obs[:, 2], obs[:, 3], obs[:, 4] = gap
+        return obs
+
+    def step(self, jumps, bounds, gaps=None):
+        """
+        Advance every alive bird by one frame
+
+        Args:
+            jumps: Boolean array, True where a bird decided to jump
+            bounds: Pipe pair geometry from PipeManager.bounds() (already moved this frame)
+            gaps: Optional (gap_tops, gap_bottoms), arrays of shape (population_size, len(bounds)),
+                for birds flying different courses; overrides the gap columns of bounds
+
+        Returns:
+            int: Number of birds that were alive at the start of the frame
+        """
+        alive = self.alive
+        alive_count = int(np.count_nonzero(alive))
+        if alive_count == 0:
+            return 0
+
+        # Jump, gravity and velocity clamp
+        self.velocity[alive & jumps] = BIRD_JUMP
+        velocity = self.velocity
+        velocity[alive] += GRAVITY
+        np.minimum(velocity, BIRD_MAX_VELOCITY, out=velocity)
+        self.top[alive] += np.trunc(velocity[alive]).astype(np.int64)
+
+        # Fitness for staying alive and for passing the first pipe
+        self.fitness[alive] += 0.1
+        if len(bounds):
+            first_left, first_right = bounds[0, 0], bounds[0, 1]
+            if self.left > first_left and self.right < first_right:
+                self.fitness[alive] += 0.5
+            elif self.left > first_right:
+                self.fitness[alive] += 5.0
+
+        # Ground, ceiling and pipe AABB collision
+        top = self.top
+        bottom = top + self.height
+        dead = (top <= 0) | (bottom >= self.ground_y)
+        if len(bounds):
+            x_overlap = (self.left < bounds[:, 1]) & (self.right > bounds[:, 0])
+            if gaps is None:
+                gap_tops, gap_bottoms = bounds[x_overlap, 2], bounds[x_overlap, 3]
+            else:
+                gap_tops, gap_bottoms = gaps[0][:, x_overlap].T, gaps[1][:, x_overlap].T
+            for gap_top, gap_bottom in zip(gap_tops, gap_bottoms):
+                # Top pipe spans [gap_top - height, gap_top), bottom pipe [gap_bottom, gap_bottom + height)
+                dead |= (top < gap_top) & (bottom > gap_top - PIPE_SIZE[1])
+                dead |= (bottom > gap_bottom) & (top < gap_bottom + PIPE_SIZE[1])
+        alive &= ~dead
+
+        return alive_count
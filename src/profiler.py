@@ -0,0 +1,154 @@
+import cProfile
+import contextlib
+import csv
+import json
+import time
+
+
+class _NullPhase:
+    """Context manager that does nothing - used while profiling is off"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+class _Phase:
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.add_time(self.name, time.perf_counter() - self.start)
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class Profiler:
+    """Low-overhead per-phase timers and counters
+
+    Disabled by default: phase() then returns a shared no-op context
+    manager and count() returns immediately, so instrumented hot paths
+    cost one attribute check.
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.totals = {}    # seconds per phase since the last end_generation
+        self.calls = {}     # calls per phase since the last end_generation
+        self.counters = {}  # counts since the last end_generation
+        self.records = []   # one dict per finished generation
+        self.cprofile = None
+
+    def enable(self, enabled=True):
+        self.enabled = enabled
+
+    @contextlib.contextmanager
+    def paused(self):
+        """Leave a block out of the timings and counters, e.g. bookkeeping outside the training loop"""
+        enabled = self.enabled
+        self.enabled = False
+        try:
+            yield
+        finally:
+            self.enabled = enabled
+
+    def phase(self, name):
+        """
+        Time a block of code
+
+        Usage:
+            with PROFILER.phase('think'):
+                ...
+        """
+        if not self.enabled:
+            return _NULL_PHASE
+        return _Phase(self, name)
+
+    def add_time(self, name, seconds):
+        self.totals[name] = self.totals.get(name, 0.0) + seconds
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def count(self, name, n=1):
+        """Add n to a named counter"""
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def breakdown(self, record=None):
+        """
+        Time per phase of a finished generation, or since the last one finished
+
+        Args:
+            record: Optional dict returned by end_generation (or taken from records)
+
+        Returns:
+            list: (phase, milliseconds, share of tracked time) sorted slowest first
+        """
+        if record is None:
+            times = {name: seconds * 1000 for name, seconds in self.totals.items()}
+        else:
+            times = {key[:-3]: value for key, value in record.items() if key.endswith('_ms')}
+        total = sum(times.values()) or 1.0
+        return sorted(((name, ms, ms / total) for name, ms in times.items()),
+                      key=lambda item: item[1], reverse=True)
+
+    def end_generation(self, generation):
+        """
+        Close the timing record of a generation and start a new one
+
+        Args:
+            generation: Number of the generation that just finished
+
+        Returns:
+            dict: The finished record
+        """
+        if not self.enabled:
+            return None
+        record = {'generation': generation}
+        for name, seconds in self.totals.items():
+            record[f'{name}_ms'] = seconds * 1000
+            record[f'{name}_calls'] = self.calls[name]
+        record.update(self.counters)
+        self.records.append(record)
+        self.totals = {}
+        self.calls = {}
+        self.counters = {}
+        return record
+
+    def export(self, path):
+        """Write all generation records as .csv or .json (chosen by extension)"""
+        if path.endswith('.csv'):
+            fields = []
+            for record in self.records:
+                fields.extend(key for key in record if key not in fields)
+            with open(path, 'w', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=fields)
+                writer.writeheader()
+                writer.writerows(self.records)
+        else:
+            with open(path, 'w') as f:
+                json.dump(self.records, f, indent=2)
+
+    def start_cprofile(self):
+        """Start a cProfile session alongside the phase timers"""
+        self.cprofile = cProfile.Profile()
+        self.cprofile.enable()
+
+    def stop_cprofile(self, path):
+        """Stop the cProfile session and dump its stats (readable with pstats)"""
+        if self.cprofile is not None:
+            self.cprofile.disable()
+            self.cprofile.dump_stats(path)
+            self.cprofile = None
+
+
+# Process-wide profiler used by all instrumented code
+PROFILER = Profiler()
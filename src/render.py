@@ -0,0 +1,46 @@
+from src.settings import *
+
+# Above this many rects a single bounding rect is cheaper to push
+MAX_DIRTY_RECTS = 64
+
+
+class DirtyRects:
+    """Tracks which screen regions changed since the last display update
+
+    A region is dirty if something was drawn there this frame or was drawn
+    there last frame (it has to be pushed again so the old image disappears).
+    """
+
+    def __init__(self):
+        self.previous = []
+        self.current = []
+
+    def add(self, rect):
+        """Mark a region drawn this frame"""
+        if rect.width and rect.height:
+            self.current.append(rect)
+
+    def reset(self):
+        """Forget all tracked regions, e.g. after a full-screen update"""
+        self.previous = []
+        self.current = []
+
+    def flush(self):
+        """
+        Regions to pass to pygame.display.update for this frame
+
+        Returns:
+            list: pygame.Rect objects
+        """
+        rects = self.previous + self.current
+        self.previous = self.current
+        self.current = []
+        if len(rects) > MAX_DIRTY_RECTS:
+            rects = [rects[0].unionall(rects[1:])]
+        return rects
+
+
+def blit_group(screen, group, dirty):
+    """Draw a sprite group and mark what it covered as dirty"""
+    for sprite in group:
+        dirty.add(screen.blit(sprite.image, sprite.rect))
@@ -0,0 +1,259 @@
+import os
+import struct
+import numpy as np
+from src.settings import *
+from src.neural_network import NeuralNetwork
+from src.profiler import PROFILER
+
+REPLAY_MAGIC = b'FBRP'
+REPLAY_VERSION = 1
+
+# course seed, generation, genome hash, fitness, max frames, recorded frames, layer sizes, genome bytes
+_RECORD = struct.Struct('<QQ16sdIIHHHI')
+
+
+class Replay:
+    """One bird's episode stored as its course and the jump decision of every frame
+
+    The game is deterministic given the course seed and the jumps, so a
+    replay rebuilds the exact trajectory at 1 bit per simulated frame
+    (under 8 bytes per second of play). The genome that flew the episode
+    is identified by its hash and can optionally be stored as well.
+    """
+
+    def __init__(self, course_seed, jumps, fitness=0.0, genome_id='', generation=0,
+                 max_frames=GENERATION_TIMEOUT_FRAMES, genome=None):
+        """
+        Args:
+            course_seed: Seed of the pipe course
+            jumps: Sequence of booleans, one per frame the bird was alive
+            fitness: Fitness the episode ended with
+            genome_id: NeuralNetwork.genome_hash() of the bird
+            generation: Generation the episode was flown in
+            max_frames: Frame limit the episode ran under
+            genome: Optional NeuralNetwork that flew the episode
+        """
+        self.course_seed = course_seed
+        self.jumps = np.asarray(jumps, dtype=bool)
+        self.fitness = fitness
+        self.genome_id = genome_id
+        self.generation = generation
+        self.max_frames = max_frames
+        self.genome = genome
+
+    def __len__(self):
+        """Number of recorded frames"""
+        return len(self.jumps)
+
+    def to_bytes(self):
+        """Compact binary form: fixed header, optional genome, bit-packed jumps"""
+        if self.genome is not None:
+            sizes = (self.genome.input_size, self.genome.hidden_size, self.genome.output_size)
+            genome = self.genome.to_bytes()
+        else:
+            sizes, genome = (0, 0, 0), b''
+        header = _RECORD.pack(self.course_seed, self.generation,
+                              bytes.fromhex(self.genome_id) if self.genome_id else bytes(16),
+                              self.fitness, self.max_frames, len(self.jumps), *sizes, len(genome))
+        return header + genome + np.packbits(self.jumps).tobytes()
+
+    @classmethod
+    def from_bytes(cls, data, offset=0):
+        """
+        Read a replay written by to_bytes
+
+        Returns:
+            tuple: (Replay, offset just past the record)
+        """
+        (course_seed, generation, genome_id, fitness, max_frames, frames,
+         input_size, hidden_size, output_size, genome_size) = _RECORD.unpack_from(data, offset)
+        offset += _RECORD.size
+        genome = None
+        if genome_size:
+            genome = NeuralNetwork.from_bytes(data[offset:offset + genome_size],
+                                              input_size, hidden_size, output_size)
+            offset += genome_size
+        packed = -(-frames // 8)
+        jumps = np.unpackbits(np.frombuffer(data, dtype=np.uint8, count=packed, offset=offset),
+                              count=frames).astype(bool)
+        offset += packed
+        genome_id = genome_id.hex() if any(genome_id) else ''
+        return cls(course_seed, jumps, fitness, genome_id, generation, max_frames, genome), offset
+
+
+def save_replays(path, replays):
+    """Write replays to a file, replacing it"""
+    with open(path, 'wb') as f:
+        f.write(REPLAY_MAGIC + struct.pack('<H', REPLAY_VERSION))
+        for replay in replays:
+            f.write(replay.to_bytes())
+
+
+def append_replay(path, replay):
+    """Add one replay to a replay file, creating it if needed"""
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        save_replays(path, [replay])
+        return
+    with open(path, 'ab') as f:
+        f.write(replay.to_bytes())
+
+
+def load_replays(path):
+    """
+    Read every replay of a replay file
+
+    Returns:
+        list: Replay objects in the order they were written
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if data[:4] != REPLAY_MAGIC:
+        raise ValueError(f"{path} is not a replay file")
+    version, = struct.unpack_from('<H', data, 4)
+    if version != REPLAY_VERSION:
+        raise ValueError(f"Unsupported replay version {version}")
+    replays = []
+    offset = 6
+    while offset < len(data):
+        replay, offset = Replay.from_bytes(data, offset)
+        replays.append(replay)
+    return replays
+
+
+class RecordingBrain:
+    """Wraps a network and remembers every decision it makes"""
+
+    def __init__(self, brain):
+        self.brain = brain
+        self.jumps = []
+
+    def predict(self, *observation):
+        decision = bool(self.brain.predict(*observation))
+        self.jumps.append(decision)
+        return decision
+
+
+class ReplayBrain:
+    """Stands in for a network and repeats the decisions of a replay"""
+
+    def __init__(self, jumps):
+        self.jumps = jumps
+        self.frame = 0
+
+    def predict(self, *observation):
+        decision = bool(self.jumps[self.frame]) if self.frame < len(self.jumps) else False
+        self.frame += 1
+        return decision
+
+
+def record_episode(brain, course_seed, generation=0, max_frames=GENERATION_TIMEOUT_FRAMES,
+                   include_genome=False):
+    """
+    Fly one network on a course and record it
+
+    Args:
+        brain: NeuralNetwork to record
+        course_seed: Seed of the pipe course
+        generation: Generation number stored with the replay
+        max_frames: Frame limit of the episode
+        include_genome: Store the network in the replay as well
+
+    Returns:
+        Replay
+    """
+    from src.headless import HeadlessGame
+
+    recorder = RecordingBrain(brain)
+    game = HeadlessGame(max_frames=max_frames)
+    game.ai_brains = [recorder]
+    fitness = game.simulate(course_seed)[0]
+    return Replay(course_seed, recorder.jumps, fitness, brain.genome_hash(), generation, max_frames,
+                  brain.copy() if include_genome else None)
+
+
+def play_headless(replay):
+    """
+    Rebuild a replay through the sprite engine without a display
+
+    Returns:
+        tuple: (fitness, frames flown)
+    """
+    from src.headless import HeadlessGame
+
+    player = ReplayBrain(replay.jumps)
+    game = HeadlessGame(max_frames=replay.max_frames)
+    game.ai_brains = [player]
+    fitness = game.simulate(replay.course_seed)[0]
+    return fitness, player.frame
+
+
+def play_vec_env(replay):
+    """
+    Rebuild a replay through VecEnv
+
+    Returns:
+        tuple: (fitness, frames flown)
+    """
+    from src.vec_env import VecEnv
+
+    env = VecEnv(1, max_frames=replay.max_frames)
+    env.reset([replay.course_seed])
+    action = np.zeros(1, dtype=bool)
+    for frame in range(len(replay.jumps)):
+        action[0] = replay.jumps[frame]
+        _, _, done = env.step(action)
+        if done[0]:
+            return float(env.final_return[0]), frame + 1
+    return float(env.episode_return[0]), len(replay.jumps)
+
+
+def verify_replay(replay, tolerance=1e-9):
+    """
+    Use a replay as a golden trace for the simulation paths
+
+    Every path must fly exactly the recorded frames and reach the recorded
+    fitness. With a stored genome, the array-backed engine (HeadlessGame
+    vectorized and the batched multi-course evaluator) is checked too.
+
+    Args:
+        replay: Replay to check
+        tolerance: Allowed absolute fitness difference (VecEnv sums rewards in a different order)
+
+    Returns:
+        dict: path name -> (fitness, frames, matches)
+    """
+    from src.headless import HeadlessGame
+    from src.multi_course import simulate_courses
+
+    frames = len(replay.jumps)
+    results = {}
+    fitness, flown = play_headless(replay)
+    results['sprites'] = (fitness, flown, fitness == replay.fitness and flown == frames)
+    fitness, flown = play_vec_env(replay)
+    results['vec_env'] = (fitness, flown, abs(fitness - replay.fitness) <= tolerance and flown == frames)
+
+    if replay.genome is not None:
+        game = HeadlessGame(max_frames=replay.max_frames, vectorized=True)
+        game.ai_brains = [replay.genome]
+        fitness = game.simulate(replay.course_seed)[0]
+        results['vectorized'] = (fitness, None, fitness == replay.fitness)
+        fitness = float(simulate_courses([replay.genome], [replay.course_seed], replay.max_frames)[0, 0])
+        results['multi_course'] = (fitness, None, fitness == replay.fitness)
+    return results
+
+
+class ReplayRecorder:
+    """Appends a replay to a file every time training sets a new record"""
+
+    def __init__(self, path, include_genome=True):
+        self.path = path
+        self.include_genome = include_genome
+        self.count = 0
+
+    def record(self, brain, course_seed, generation, max_frames=GENERATION_TIMEOUT_FRAMES):
+        # The extra episode is not part of training, keep it out of the generation timings
+        with PROFILER.paused():
+            replay = record_episode(brain, course_seed, generation, max_frames, self.include_genome)
+        append_replay(self.path, replay)
+        self.count += 1
+        return replay
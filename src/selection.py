@@ -0,0 +1,145 @@
+import numpy as np
+
+
+def _random_indices(n, shape, rng):
+    """Uniform random indices in [0, n) - works with np.random and Generators alike"""
+    return np.minimum((rng.random(shape) * n).astype(np.int64), n - 1)
+
+
+def _sample_cumulative(weights, count, rng):
+    """Draw count indices with probability proportional to weights"""
+    cumulative = np.cumsum(weights)
+    picks = rng.random(count) * cumulative[-1]
+    return np.minimum(np.searchsorted(cumulative, picks, side='right'), len(weights) - 1)
+
+
+def _shifted_fitness(fitness):
+    """Fitness moved to be non-negative; all-equal fitness gives equal weights"""
+    weights = fitness - fitness.min()
+    if not weights.any():
+        return np.ones_like(weights)
+    return weights
+
+
+def tournament_selection(fitness, count, rng=np.random, tournament_size=5):
+    """
+    Pick the fittest of tournament_size random contestants, count times at once
+
+    Args:
+        fitness: numpy array of shape (population_size,)
+        count: Number of parents to select
+        rng: numpy random module or Generator
+        tournament_size: Contestants per tournament
+
+    Returns:
+        numpy array of shape (count,) with population indices
+    """
+    size = min(tournament_size, len(fitness))
+    contestants = _random_indices(len(fitness), (count, size), rng)
+    winners = np.argmax(fitness[contestants], axis=1)
+    return contestants[np.arange(count), winners]
+
+
+def rank_selection(fitness, count, rng=np.random):
+    """
+    Select with probability proportional to fitness rank (worst = 1, best = population_size)
+
+    Args:
+        fitness: numpy array of shape (population_size,)
+        count: Number of parents to select
+        rng: numpy random module or Generator
+
+    Returns:
+        numpy array of shape (count,) with population indices
+    """
+    ranks = np.empty(len(fitness), dtype=np.float64)
+    ranks[np.argsort(fitness, kind='stable')] = np.arange(1, len(fitness) + 1)
+    return _sample_cumulative(ranks, count, rng)
+
+
+def roulette_selection(fitness, count, rng=np.random):
+    """
+    Select with probability proportional to fitness (shifted so the worst bird has zero)
+
+    Args:
+        fitness: numpy array of shape (population_size,)
+        count: Number of parents to select
+        rng: numpy random module or Generator
+
+    Returns:
+        numpy array of shape (count,) with population indices
+    """
+    return _sample_cumulative(_shifted_fitness(fitness), count, rng)
+
+
+def sus_selection(fitness, count, rng=np.random):
+    """
+    Stochastic universal sampling
+
+    Like roulette selection, but one spin places count evenly spaced
+    pointers, so every bird is picked close to its expected number of times.
+
+    Args:
+        fitness: numpy array of shape (population_size,)
+        count: Number of parents to select
+        rng: numpy random module or Generator
+
+    Returns:
+        numpy array of shape (count,) with population indices, shuffled
+    """
+    cumulative = np.cumsum(_shifted_fitness(fitness))
+    step = cumulative[-1] / count
+    pointers = (rng.random() + np.arange(count)) * step
+    picks = np.minimum(np.searchsorted(cumulative, pointers, side='right'), len(fitness) - 1)
+    # Pointers come out in population order - shuffle so pairs are not always neighbours
+    return rng.permutation(picks)
+
+
+SELECTION_METHODS = {
+    'tournament': tournament_selection,
+    'rank': rank_selection,
+    'roulette': roulette_selection,
+    'sus': sus_selection,
+}
+
+
+def select_indices(fitness, count, method='tournament', rng=np.random, **kwargs):
+    """
+    Select count parents in a single batched call
+
+    Args:
+        fitness: Fitness scores as a list or numpy array
+        count: Number of parents to select
+        method: One of SELECTION_METHODS
+        rng: numpy random module or Generator
+        **kwargs: Extra options for the method (e.g. tournament_size for 'tournament')
+
+    Returns:
+        numpy array of shape (count,) with population indices
+    """
+    if method not in SELECTION_METHODS:
+        raise ValueError(f"Unknown selection method: {method}")
+    fitness = np.asarray(fitness, dtype=np.float64)
+    return SELECTION_METHODS[method](fitness, count, rng, **kwargs)
+
+
+def select_elites(fitness, count):
+    """
+    Indices of the count fittest birds, best first
+
+    Uses argpartition, so only the elites themselves are sorted.
+
+    Args:
+        fitness: Fitness scores as a list or numpy array
+        count: Number of elites
+
+    Returns:
+        numpy array of shape (count,) with population indices
+    """
+    fitness = np.asarray(fitness, dtype=np.float64)
+    count = min(count, len(fitness))
+    if count < len(fitness):
+        top = np.argpartition(-fitness, count - 1)[:count]
+    else:
+        top = np.arange(len(fitness))
+    return top[np.argsort(-fitness[top], kind='stable')]
@@ -14,10 +14,31 @@ SKY_BLUE = (0, 191, 255)
 # Physics
 GRAVITY = 0.25
 BIRD_JUMP = -5
+BIRD_MAX_VELOCITY = 8
 BIRD_START_POS = (50, SCREEN_HEIGHT // 2)
 PIPE_SPEED = 3
 PIPE_GAP = 150
 PIPE_FREQUENCY = 1500  # milliseconds
+GENERATION_TIMEOUT = 30000  # milliseconds
+GROUND_Y = SCREEN_HEIGHT - 100
+
+# AI speed levels (simulation steps per rendered frame); TURBO runs as many as fit
+# in SIM_FRAME_BUDGET seconds of each display frame
+TURBO = float('inf')
+AI_SPEED_LEVELS = [1, 2, 5, 10, 25, 50, 100, TURBO]
+SIM_FRAME_BUDGET = 0.75 / FPS
+
+# Frame-based equivalents for simulation without a wall clock
+PIPE_FREQUENCY_FRAMES = PIPE_FREQUENCY * FPS // 1000
+GENERATION_TIMEOUT_FRAMES = GENERATION_TIMEOUT * FPS // 1000
+BIRD_FLAP_FRAMES = 5
+
+# Sprite sizes after scale2x, used when no images are loaded
+BIRD_SIZE = (68, 48)
+PIPE_SIZE = (104, 640)
+
+# Most pipe pairs that can be on screen at once (plus one spare)
+PIPE_POOL_SIZE = -(-(SCREEN_WIDTH + PIPE_SIZE[0]) // (PIPE_SPEED * PIPE_FREQUENCY_FRAMES)) + 1
 
 # Asset Paths
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -30,3 +51,78 @@ def load_image(filename):
     if os.path.exists(path):
         return pygame.image.load(path)
     return None
+
+
+class AssetRegistry:
+    """Process-wide sprite cache
+
+    Each sprite is loaded, converted, scaled and flipped once and the
+    resulting surface is shared by every Bird, Pipe and screen that
+    asks for it. In headless mode no image is ever decoded.
+    """
+
+    def __init__(self):
+        self.surfaces = {}
+        self.headless = False
+
+    def set_headless(self, headless=True):
+        """Skip image loading entirely - get() returns None"""
+        self.headless = headless
+
+    def get(self, filename, scale2x=False, flip=False, size=None):
+        """
+        Fetch a prepared sprite
+
+        Args:
+            filename: Image file inside SPRITES_DIR
+            scale2x: Double the image size
+            flip: Flip the image vertically
+            size: Optional (width, height) to scale to
+
+        Returns:
+            pygame.Surface shared between callers, or None if unavailable
+        """
+        if self.headless:
+            return None
+
+        key = (filename, scale2x, flip, size)
+        if key not in self.surfaces:
+            self.surfaces[key] = self._prepare(filename, scale2x, flip, size)
+        return self.surfaces[key]
+
+    def _prepare(self, filename, scale2x, flip, size):
+        image = load_image(filename)
+        if image is None:
+            return None
+        # convert_alpha needs a display mode; without one keep the raw surface
+        if pygame.display.get_surface() is not None:
+            image = image.convert_alpha()
+        if scale2x:
+            image = pygame.transform.scale2x(image)
+        if size:
+            image = pygame.transform.scale(image, size)
+        if flip:
+            image = pygame.transform.flip(image, False, True)
+        return image
+
+    def get_derived(self, key, build):
+        """
+        Fetch or build a cached object derived from sprites (e.g. a rotation atlas)
+
+        Args:
+            key: Hashable cache key
+            build: Function called once to create the object
+
+        Returns:
+            The cached object
+        """
+        if key not in self.surfaces:
+            self.surfaces[key] = build()
+        return self.surfaces[key]
+
+    def clear(self):
+        """Drop every cached surface"""
+        self.surfaces.clear()
+
+
+ASSETS = AssetRegistry()
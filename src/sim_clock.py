@@ -0,0 +1,22 @@
+class SimClock:
+    """Frame counter that drives all gameplay timing
+
+    Pipe spawning, generation timeouts and animation are measured in
+    simulated frames rather than wall-clock milliseconds, so a run
+    behaves identically at 1x, 10x or headless speed.
+    """
+
+    def __init__(self):
+        self.frame = 0
+
+    def tick(self):
+        """Advance the clock by one simulated frame"""
+        self.frame += 1
+
+    def reset(self):
+        """Restart counting from frame 0"""
+        self.frame = 0
+
+    def frames_since(self, mark):
+        """Frames elapsed since an earlier value of frame"""
+        return self.frame - mark
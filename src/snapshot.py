@@ -0,0 +1,169 @@
+import time
+from multiprocessing import shared_memory
+import numpy as np
+from src.settings import *
+
+# Header words: published snapshot count, ring capacity, max birds, stop flag
+_HEADER = 4
+_SEQ, _CAPACITY, _MAX_BIRDS, _STOP = range(_HEADER)
+
+
+def snapshot_dtype(max_birds, pipe_slots=PIPE_POOL_SIZE):
+    """Layout of one snapshot in the ring"""
+    return np.dtype([
+        ('frame', np.int64),
+        ('generation', np.int64),
+        ('bird_count', np.int64),
+        ('alive_count', np.int64),
+        ('pipe_count', np.int64),
+        ('best_fitness', np.float64),
+        ('avg_fitness', np.float64),
+        ('record', np.float64),
+        ('steps_per_second', np.float64),
+        ('bird_top', np.int32, (max_birds,)),
+        ('bird_velocity', np.float32, (max_birds,)),
+        ('alive', np.bool_, (max_birds,)),
+        ('pipe_x', np.int32, (pipe_slots,)),
+        ('pipe_gap_center', np.int32, (pipe_slots,)),
+    ])
+
+
+class SnapshotRing:
+    """Ring buffer of simulation snapshots in shared memory
+
+    One process writes, any number read. The writer fills the slot after
+    the newest one and only then bumps the published count, so a reader
+    that picks the newest slot never sees a half-written snapshot - as
+    long as the writer does not lap the whole ring while the reader is
+    still looking, which publish rate limiting on the writer side makes
+    practically impossible (see SnapshotPublisher).
+    """
+
+    def __init__(self, name=None, max_birds=50, capacity=16):
+        """
+        Create a new ring, or attach to an existing one by name
+
+        Args:
+            name: Shared memory block to attach to (None creates one)
+            max_birds: Birds per snapshot (ignored when attaching)
+            capacity: Snapshots in the ring (ignored when attaching)
+        """
+        header_size = _HEADER * np.dtype(np.int64).itemsize
+        if name is None:
+            size = header_size + capacity * snapshot_dtype(max_birds).itemsize
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+            self.owner = True
+            self.header = np.ndarray((_HEADER,), dtype=np.int64, buffer=self.shm.buf)
+            self.header[:] = (0, capacity, max_birds, 0)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            self.owner = False
+            self.header = np.ndarray((_HEADER,), dtype=np.int64, buffer=self.shm.buf)
+        self.capacity = int(self.header[_CAPACITY])
+        self.max_birds = int(self.header[_MAX_BIRDS])
+        self.slots = np.ndarray((self.capacity,), dtype=snapshot_dtype(self.max_birds),
+                                buffer=self.shm.buf, offset=header_size)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    @property
+    def published(self):
+        """Number of snapshots written so far"""
+        return int(self.header[_SEQ])
+
+    def next_slot(self):
+        """Slot the writer fills next - call publish() once it is complete"""
+        return self.slots[self.published % self.capacity]
+
+    def publish(self):
+        self.header[_SEQ] += 1
+
+    def latest(self):
+        """
+        Newest complete snapshot
+
+        Returns:
+            numpy record viewing shared memory (not a copy), or None before the first publish
+        """
+        published = self.published
+        if published == 0:
+            return None
+        return self.slots[(published - 1) % self.capacity]
+
+    def request_stop(self):
+        self.header[_STOP] = 1
+
+    @property
+    def stop_requested(self):
+        return bool(self.header[_STOP])
+
+    def close(self):
+        """Detach; the creating process also frees the block"""
+        # Views must go before the buffer can be released
+        self.header = None
+        self.slots = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+class SnapshotPublisher:
+    """Copies the state of a vectorized HeadlessGame into a SnapshotRing
+
+    Attach as HeadlessGame.frame_callback. Snapshots are published at most
+    max_rate times per second; a spectator rendering at FPS never needs
+    more, and the ring then holds capacity / max_rate seconds of history
+    before a slot is reused.
+    """
+
+    def __init__(self, ring, max_rate=4 * FPS):
+        self.ring = ring
+        self.interval = 1.0 / max_rate
+        self.last_publish = 0.0
+        self.frames = 0
+        self.rate_start = time.perf_counter()
+        self.steps_per_second = 0.0
+
+    def __call__(self, trainer):
+        """
+        Publish a snapshot if one is due
+
+        Returns:
+            bool: True once the spectator asked the trainer to stop, ending the episode early
+        """
+        if self.ring.stop_requested:
+            return True
+        self.frames += 1
+        now = time.perf_counter()
+        if now - self.last_publish < self.interval:
+            return False
+        if now - self.rate_start >= 0.5:
+            self.steps_per_second = self.frames / (now - self.rate_start)
+            self.frames = 0
+            self.rate_start = now
+        self.last_publish = now
+
+        sim = trainer.simulator
+        count = min(sim.population_size, self.ring.max_birds)
+        snapshot = self.ring.next_slot()
+        snapshot['frame'] = trainer.clock.frame
+        snapshot['generation'] = trainer.ga.generation
+        snapshot['bird_count'] = count
+        snapshot['alive_count'] = np.count_nonzero(sim.alive)
+        snapshot['best_fitness'] = sim.fitness.max()
+        snapshot['avg_fitness'] = sim.fitness.mean()
+        snapshot['record'] = trainer.ga.best_fitness
+        snapshot['steps_per_second'] = self.steps_per_second
+        snapshot['bird_top'][:count] = sim.top[:count]
+        snapshot['bird_velocity'][:count] = sim.velocity[:count]
+        snapshot['alive'][:count] = sim.alive[:count]
+
+        bounds = trainer.pipes.bounds()
+        pipes = min(len(bounds), len(snapshot['pipe_x']))
+        snapshot['pipe_count'] = pipes
+        snapshot['pipe_x'][:pipes] = bounds[:pipes, 0]
+        snapshot['pipe_gap_center'][:pipes] = (bounds[:pipes, 2] + bounds[:pipes, 3]) // 2
+        self.ring.publish()
+        return False
@@ -0,0 +1,119 @@
+import numpy as np
+import pygame
+from src.settings import *
+from src.bird import Bird, rotation_index, BIRD_FRAMES
+from src.pipe import PipeManager
+from src.ui import draw_text, get_panel
+from src.snapshot import SnapshotRing, SnapshotPublisher
+
+
+def run_trainer(ring_name, population_size=50, seed=None):
+    """
+    Worker process entry point - train headless and publish snapshots until asked to stop
+
+    Args:
+        ring_name: Shared memory name of the SnapshotRing to write to
+        population_size: Birds per generation
+        seed: Random seed for reproducible runs
+    """
+    # Imported here so the spectator process never builds a trainer
+    from src.headless import HeadlessGame
+
+    ASSETS.set_headless()
+    ring = SnapshotRing(ring_name)
+    trainer = HeadlessGame(population_size=population_size, seed=seed, vectorized=True)
+    trainer.frame_callback = SnapshotPublisher(ring)
+    try:
+        while not ring.stop_requested:
+            trainer.train(1)
+    finally:
+        trainer.frame_callback = None
+        ring.close()
+
+
+class Spectator:
+    """Window that draws the newest snapshot of a training run in another process
+
+    Rendering never waits for the simulation and the simulation never
+    waits for rendering: each frame simply shows whatever snapshot was
+    published last, straight from shared memory.
+    """
+
+    def __init__(self, ring):
+        """
+        Args:
+            ring: SnapshotRing written by run_trainer
+        """
+        pygame.init()
+        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pygame.display.set_caption("Flappy Bird AI 2025 - Spectator")
+        self.clock = pygame.time.Clock()
+        self.ring = ring
+
+        self.bg_img = ASSETS.get('background-day.png', size=(SCREEN_WIDTH, SCREEN_HEIGHT))
+        if not self.bg_img:
+            self.bg_img = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            self.bg_img.fill(SKY_BLUE)
+        self.ground_img = ASSETS.get('base.png', scale2x=True)
+        if not self.ground_img:
+            self.ground_img = pygame.Surface((SCREEN_WIDTH, 100))
+            self.ground_img.fill((222, 184, 135))
+
+        # One sprite bird for the rotation atlas, a pipe pool to position each frame
+        self.rotations = Bird().rotations
+        self.bird_center_x = BIRD_START_POS[0]
+        self.pipes = PipeManager()
+
+    def draw(self, snapshot):
+        """Draw one snapshot onto the screen"""
+        self.screen.blit(self.bg_img, (0, 0))
+        if snapshot is None:
+            draw_text(self.screen, "Waiting for trainer...", 20, SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, WHITE)
+            return
+
+        self.pipes.clear()
+        for x, gap_center in zip(snapshot['pipe_x'][:snapshot['pipe_count']].tolist(),
+                                 snapshot['pipe_gap_center'][:snapshot['pipe_count']].tolist()):
+            self.pipes.spawn(gap_center, x)
+        self.pipes.group.draw(self.screen)
+
+        frame = int(snapshot['frame'])
+        images = self.rotations[(frame // BIRD_FLAP_FRAMES) % len(BIRD_FRAMES)]
+        count = int(snapshot['bird_count'])
+        tops = snapshot['bird_top'][:count]
+        velocities = snapshot['bird_velocity'][:count]
+        half_height = BIRD_SIZE[1] // 2
+        for i in np.flatnonzero(snapshot['alive'][:count]).tolist():
+            image = images[rotation_index(float(velocities[i]))]
+            self.screen.blit(image, image.get_rect(center=(self.bird_center_x, int(tops[i]) + half_height)))
+
+        # Same 36 px scroll cycle as Game.update_game
+        self.screen.blit(self.ground_img, (-(frame * PIPE_SPEED % 36), GROUND_Y))
+
+        self.screen.blit(get_panel(SCREEN_WIDTH, 120, (50, 50, 50), 200), (0, 0))
+        draw_text(self.screen, f"Gen: {snapshot['generation']}", 15, 60, 15, WHITE)
+        draw_text(self.screen, f"Alive: {snapshot['alive_count']}", 15, 60, 35, WHITE)
+        draw_text(self.screen, f"Best: {int(snapshot['best_fitness'])}", 15, 60, 55, WHITE)
+        draw_text(self.screen, f"Avg: {int(snapshot['avg_fitness'])}", 15, 60, 75, WHITE)
+        draw_text(self.screen, f"Record: {int(snapshot['record'])}", 15, 60, 95, WHITE)
+        draw_text(self.screen, "Spectating", 15, SCREEN_WIDTH - 60, 15, WHITE)
+        draw_text(self.screen, f"{int(snapshot['steps_per_second'])} steps/s", 12, SCREEN_WIDTH - 60, 35, WHITE)
+
+    def run(self, trainer_process=None):
+        """
+        Render at FPS until the window is closed or the trainer exits
+
+        Args:
+            trainer_process: Optional multiprocessing.Process running run_trainer
+        """
+        running = True
+        while running:
+            self.clock.tick(FPS)
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+            if trainer_process is not None and not trainer_process.is_alive():
+                running = False
+            self.draw(self.ring.latest())
+            pygame.display.flip()
+        pygame.quit()
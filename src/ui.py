@@ -1,28 +1,105 @@
 import pygame
+from collections import OrderedDict
 from src.settings import *
 
+_fonts = {}
+
+def get_font(name='Arial', size=20, bold=True):
+    """Font objects keyed by (name, size, bold), created on first use"""
+    key = (name, size, bold)
+    if key not in _fonts:
+        _fonts[key] = pygame.font.SysFont(name, size, bold=bold)
+    return _fonts[key]
+
+
+class SurfaceCache:
+    """Bounded LRU of pre-rendered surfaces"""
+
+    def __init__(self, max_size=256):
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+
+    def get(self, key, build):
+        """
+        Fetch a cached surface, building it on a miss
+
+        Args:
+            key: Hashable cache key
+            build: Function returning the surface
+
+        Returns:
+            pygame.Surface
+        """
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = build()
+            self.surfaces[key] = surface
+            if len(self.surfaces) > self.max_size:
+                self.surfaces.popitem(last=False)
+        else:
+            self.surfaces.move_to_end(key)
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+
+
+# Rendered text keyed by (text, size, color, bold); static screens keyed by their contents
+TEXT_CACHE = SurfaceCache(max_size=256)
+OVERLAY_CACHE = SurfaceCache(max_size=16)
+
+def render_text(text, size, color=BLACK, bold=True):
+    """Rendered text surface, shared through TEXT_CACHE"""
+    return TEXT_CACHE.get((text, size, color, bold),
+                          lambda: get_font('Arial', size, bold).render(text, True, color))
+
+def get_overlay(key, draw):
+    """
+    Full-screen transparent overlay drawn once and reused
+
+    Args:
+        key: Hashable key identifying the overlay contents
+        draw: Function that draws onto the given surface
+
+    Returns:
+        pygame.Surface with per-pixel alpha
+    """
+    def build():
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        draw(surface)
+        return surface
+    return OVERLAY_CACHE.get(key, build)
+
+def get_panel(width, height, color, alpha):
+    """Translucent rectangle surface, built once per size/color/alpha"""
+    def build():
+        panel = pygame.Surface((width, height))
+        panel.set_alpha(alpha)
+        panel.fill(color)
+        return panel
+    return OVERLAY_CACHE.get(('panel', width, height, color, alpha), build)
+
 class Button:
     def __init__(self, x, y, width, height, text, color, text_color=BLACK):
         self.rect = pygame.Rect(x, y, width, height)
         self.text = text
         self.color = color
         self.text_color = text_color
-        self.font = pygame.font.SysFont('Arial', 20, bold=True)
+        self.font = get_font('Arial', 20, bold=True)
+        self.text_surf = self.font.render(self.text, True, self.text_color)
 
     def draw(self, screen):
         pygame.draw.rect(screen, self.color, self.rect, border_radius=5)
         pygame.draw.rect(screen, BLACK, self.rect, 2, border_radius=5)
         
-        text_surf = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surf.get_rect(center=self.rect.center)
-        screen.blit(text_surf, text_rect)
+        text_rect = self.text_surf.get_rect(center=self.rect.center)
+        screen.blit(self.text_surf, text_rect)
 
     def is_clicked(self, pos):
         return self.rect.collidepoint(pos)
 
 def draw_text(screen, text, size, x, y, color=BLACK):
-    font = pygame.font.SysFont('Arial', size, bold=True)
-    text_surf = font.render(text, True, color)
+    text_surf = render_text(text, size, color)
     text_rect = text_surf.get_rect(center=(x, y))
     screen.blit(text_surf, text_rect)
 
@@ -0,0 +1,262 @@
+import random
+import numpy as np
+from src.settings import *
+from src.course import Course, course_length
+from src.neural_network import normalize_inputs
+
+
+class VecEnv:
+    """N independent Flappy Bird environments stepped as NumPy arrays
+
+    Follows the rules of the headless engine frame for frame - the same
+    gravity, jump and velocity clamp, pipe courses from Course, collision
+    boxes and the GA fitness increments as rewards - but every environment
+    keeps its own frame counter, so finished episodes restart on their own.
+
+    Pipe pairs spawn every PIPE_FREQUENCY_FRAMES and scroll at PIPE_SPEED,
+    so the position of each pair is a function of the episode frame and no
+    pipe objects are needed.  All state and result arrays are allocated
+    once; step() writes into them and returns the same arrays every call
+    (copy them to keep a result).  Restarting an episode refills its course
+    row in place.
+
+    Usage:
+        env = VecEnv(1024, seed=0)
+        obs = env.reset()
+        while training:
+            obs, reward, done = env.step(policy(obs))
+    """
+
+    def __init__(self, num_envs, seed=None, max_frames=GENERATION_TIMEOUT_FRAMES,
+                 normalize=False, ground_y=GROUND_Y):
+        """
+        Args:
+            num_envs: Number of environments
+            seed: Seed of the stream that picks course seeds for restarted episodes
+            max_frames: Frames before an episode is cut off (done is set)
+            normalize: Return observations scaled like NeuralNetwork.predict instead of raw
+            ground_y: Y coordinate of the ground
+        """
+        self.num_envs = num_envs
+        self.max_frames = max_frames
+        self.normalize = normalize
+        self.ground_y = ground_y
+        self.rng = np.random.default_rng(seed)
+        self.course_rng = random.Random()  # Reseeded for every new course
+
+        # Bird geometry (shared) and state (per environment)
+        self.width, self.height = BIRD_SIZE
+        self.left = BIRD_START_POS[0] - self.width // 2
+        self.right = self.left + self.width
+        self.start_top = BIRD_START_POS[1] - self.height // 2
+        self.top = np.empty(num_envs, dtype=np.int64)
+        self.velocity = np.empty(num_envs, dtype=np.float64)
+        self.frame = np.empty(num_envs, dtype=np.int64)
+        self.seeds = np.zeros(num_envs, dtype=np.int64)
+
+        # Gap centres of every environment's course, one row each
+        self.course_length = course_length(max_frames)
+        self.gap_centers = np.zeros((num_envs, self.course_length), dtype=np.int64)
+        self._gap_flat = self.gap_centers.reshape(-1)
+        self._row_start = np.arange(num_envs) * self.course_length
+
+        # Candidate pipe pairs: row k holds the k-th newest spawned pair of every environment
+        self.slots = PIPE_POOL_SIZE
+        self._newest = np.empty(num_envs, dtype=np.int64)
+        self._pipe = np.empty((self.slots, num_envs), dtype=np.int64)
+        self._pipe_x = np.empty((self.slots, num_envs), dtype=np.int64)
+        self._pipe_center = np.empty((self.slots, num_envs), dtype=np.int64)
+        self._active = np.empty((self.slots, num_envs), dtype=bool)
+        self._ahead = np.empty((self.slots, num_envs), dtype=bool)
+
+        # Per-step scratch and results
+        self._int = np.empty(num_envs, dtype=np.int64)
+        self._picked = np.empty(num_envs, dtype=np.int64)
+        self._gap = np.empty(num_envs, dtype=np.int64)
+        self._float = np.empty(num_envs, dtype=np.float64)
+        self._mask = np.empty(num_envs, dtype=bool)
+        self._hit = np.empty(num_envs, dtype=bool)
+        self._pipe_hit = np.empty(num_envs, dtype=bool)
+        self._below = np.empty(num_envs, dtype=bool)
+        self._bottom = np.empty(num_envs, dtype=np.int64)
+        self._observations = np.empty((num_envs, 5), dtype=np.float64)
+        self._normalized = np.empty((num_envs, 5), dtype=np.float64)
+        self.reward = np.empty(num_envs, dtype=np.float64)
+        self.done = np.zeros(num_envs, dtype=bool)
+
+        # Episode bookkeeping for logging
+        self.episode_return = np.zeros(num_envs, dtype=np.float64)
+        self.episode_length = np.zeros(num_envs, dtype=np.int64)
+        self.final_return = np.zeros(num_envs, dtype=np.float64)
+        self.final_length = np.zeros(num_envs, dtype=np.int64)
+
+    def reset(self, seeds=None):
+        """
+        Start a new episode in every environment
+
+        Args:
+            seeds: Optional course seed per environment (drawn from the env's stream if omitted)
+
+        Returns:
+            numpy array of shape (num_envs, 5) with the first observations
+        """
+        if seeds is None:
+            seeds = self.rng.integers(2 ** 32, size=self.num_envs)
+        for env, seed in enumerate(seeds):
+            self._reset_env(env, int(seed))
+        self.done.fill(False)
+        return self._observe()
+
+    def _reset_env(self, env, seed):
+        self.seeds[env] = seed
+        Course.fill(seed, self.gap_centers[env], self.course_rng)
+        self.top[env] = self.start_top
+        self.velocity[env] = 0.0
+        self.frame[env] = 0
+        self.episode_return[env] = 0.0
+        self.episode_length[env] = 0
+
+    def _update_pipes(self):
+        """Work out the pipe pairs on screen for the current frame of every environment"""
+        frame = self.frame
+        np.floor_divide(frame, PIPE_FREQUENCY_FRAMES, out=self._newest)
+        for k in range(self.slots):
+            pipe, x = self._pipe[k], self._pipe_x[k]
+            np.subtract(self._newest, k, out=pipe)
+
+            # Pairs spawn on frames 0, F, 2F, ... at the right edge and move once on their spawn frame
+            np.multiply(pipe, PIPE_FREQUENCY_FRAMES, out=x)
+            np.subtract(frame, x, out=x)
+            x += 1
+            x *= -PIPE_SPEED
+            x += SCREEN_WIDTH
+
+            # A spawned pair stays until it has fully left the screen
+            np.greater_equal(pipe, 0, out=self._active[k])
+            np.greater_equal(x, -PIPE_SIZE[0], out=self._mask)
+            self._active[k] &= self._mask
+
+            np.maximum(pipe, 0, out=self._int)
+            self._int += self._row_start
+            np.take(self._gap_flat, self._int, out=self._pipe_center[k], mode='clip')
+
+            # Right edge still past the bird
+            np.greater(x, self.left - PIPE_SIZE[0], out=self._ahead[k])
+            self._ahead[k] &= self._active[k]
+
+    def _oldest(self, values, mask, default):
+        """
+        Value of the oldest pair selected by mask in every environment
+
+        Rows run newest to oldest, so the last selected row wins.
+        """
+        picked = self._picked
+        picked.fill(default)
+        for k in range(self.slots):
+            np.copyto(picked, values[k], where=mask[k])
+        return picked
+
+    def _observe(self):
+        """Fill and return the observation buffer for the current frame"""
+        self._update_pipes()
+        obs = self._observations
+        np.add(self.top, self.height // 2, out=self._int)
+        obs[:, 0] = self._int
+        obs[:, 1] = self.velocity
+
+        # Nearest gap ahead of the bird, or the defaults of gap_features
+        obs[:, 2] = self._oldest(self._pipe_x, self._ahead, SCREEN_WIDTH + self.left)
+        obs[:, 2] -= self.left
+        obs[:, 3] = self._oldest(self._pipe_center, self._ahead, PIPE_GAP // 2)
+        obs[:, 3] -= PIPE_GAP // 2
+        obs[:, 4] = self._oldest(self._pipe_center, self._ahead, SCREEN_HEIGHT - PIPE_GAP // 2)
+        obs[:, 4] += PIPE_GAP // 2
+        if self.normalize:
+            return normalize_inputs(obs, out=self._normalized)
+        return obs
+
+    def step(self, actions):
+        """
+        Advance every environment by one frame
+
+        Environments whose episode ended are restarted on a new course
+        before the next observation is built; for those, the returned
+        observation is the first of the new episode and final_return /
+        final_length hold the totals of the finished one.
+
+        Args:
+            actions: Array of num_envs values, truthy where the bird jumps
+
+        Returns:
+            tuple: (observations (num_envs, 5), rewards (num_envs,), done (num_envs,) bool)
+        """
+        velocity = self.velocity
+        top = self.top
+
+        # Jump, gravity and velocity clamp
+        np.not_equal(actions, False, out=self._mask)
+        np.copyto(velocity, BIRD_JUMP, where=self._mask)
+        velocity += GRAVITY
+        np.minimum(velocity, BIRD_MAX_VELOCITY, out=velocity)
+        np.trunc(velocity, out=self._float)
+        np.copyto(self._int, self._float, casting='unsafe')
+        top += self._int
+
+        # Reward mirrors the GA fitness: staying alive plus the bonus of the oldest pair
+        # (no pair on screen gives a pair at the right edge, which earns nothing)
+        reward = self.reward
+        reward.fill(0.1)
+        first = self._oldest(self._pipe_x, self._active, SCREEN_WIDTH)
+        np.less(first, self.left, out=self._mask)
+        np.add(first, PIPE_SIZE[0], out=first)  # now the pair's right edge
+        np.greater(first, self.right, out=self._hit)
+        self._hit &= self._mask
+        np.add(reward, 0.5, out=reward, where=self._hit)
+        np.less(first, self.left, out=self._mask)
+        np.add(reward, 5.0, out=reward, where=self._mask)
+
+        # Ground, ceiling and pipe AABB collision
+        done = self.done
+        bottom = self._bottom
+        np.add(top, self.height, out=bottom)
+        np.less_equal(top, 0, out=done)
+        np.greater_equal(bottom, self.ground_y, out=self._mask)
+        done |= self._mask
+        for slot in range(self.slots):
+            x = self._pipe_x[slot]
+            center = self._pipe_center[slot]
+            # Pair overlaps the bird horizontally
+            np.less(x, self.right, out=self._hit)
+            np.greater(x, self.left - PIPE_SIZE[0], out=self._mask)
+            self._hit &= self._mask
+            self._hit &= self._active[slot]
+            # Top pipe spans [gap_top - height, gap_top)
+            np.subtract(center, PIPE_GAP // 2, out=self._gap)
+            np.less(top, self._gap, out=self._pipe_hit)
+            self._gap -= PIPE_SIZE[1]
+            np.greater(bottom, self._gap, out=self._mask)
+            self._pipe_hit &= self._mask
+            # Bottom pipe spans [gap_bottom, gap_bottom + height)
+            np.add(center, PIPE_GAP // 2, out=self._gap)
+            np.greater(bottom, self._gap, out=self._mask)
+            self._gap += PIPE_SIZE[1]
+            np.less(top, self._gap, out=self._below)
+            self._mask &= self._below
+            self._pipe_hit |= self._mask
+            self._hit &= self._pipe_hit
+            done |= self._hit
+
+        # Time limit
+        self.frame += 1
+        np.greater(self.frame, self.max_frames, out=self._mask)
+        done |= self._mask
+
+        self.episode_return += reward
+        self.episode_length += 1
+        if done.any():
+            for env in np.flatnonzero(done):
+                self.final_return[env] = self.episode_return[env]
+                self.final_length[env] = self.episode_length[env]
+                self._reset_env(env, int(self.rng.integers(2 ** 32)))
+
+        return self._observe(), reward, done
@@ -0,0 +1,99 @@
+import argparse
+from src.settings import ASSETS
+from src.headless import HeadlessGame
+from src.genetic_algorithm import GeneticAlgorithm
+from src.crossover import CROSSOVER_METHODS
+from src.selection import SELECTION_METHODS
+from src.parallel import ParallelEvaluator
+from src.checkpoint import CheckpointWriter
+from src.fitness_cache import FitnessCache
+from src.multi_course import AGGREGATES
+from src.replay import ReplayRecorder
+from src.profiler import PROFILER
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train Flappy Bird AI without a display")
+    parser.add_argument('--generations', type=int, default=50, help="Number of generations to train")
+    parser.add_argument('--population', type=int, default=50, help="Birds per generation")
+    parser.add_argument('--seed', type=int, default=None, help="Random seed for reproducible runs")
+    parser.add_argument('--vectorized', action='store_true', help="Step the population as NumPy arrays")
+    parser.add_argument('--crossover', choices=sorted(CROSSOVER_METHODS), default='uniform',
+                        help="Crossover operator")
+    parser.add_argument('--selection', choices=sorted(SELECTION_METHODS), default='tournament',
+                        help="Parent selection method")
+    parser.add_argument('--tournament-size', type=int, default=5, help="Contestants per tournament")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Worker processes for fitness evaluation (0 = all CPU cores)")
+    parser.add_argument('--chunk-size', type=int, default=None, help="Birds per worker task")
+    parser.add_argument('--checkpoint', default=None, help="Write checkpoints to this .npz file")
+    parser.add_argument('--checkpoint-every', type=int, default=10, help="Generations between checkpoints")
+    parser.add_argument('--course-seed', type=int, default=None,
+                        help="Fly every generation on the same course instead of a new one each time")
+    parser.add_argument('--episodes', type=int, default=1, help="Courses every genome flies per generation")
+    parser.add_argument('--aggregate', choices=AGGREGATES, default='mean',
+                        help="How the episode scores of a genome are combined")
+    parser.add_argument('--quantile', type=float, default=0.25, help="Quantile for --aggregate quantile")
+    parser.add_argument('--fitness-cache', type=int, default=0, metavar='SIZE',
+                        help="Remember this many (genome, course) fitness scores and skip repeat episodes")
+    parser.add_argument('--record', default=None, help="Append a replay of every new record to this file")
+    parser.add_argument('--resume', default=None, help="Continue training from a checkpoint file")
+    parser.add_argument('--profile', action='store_true', help="Print a per-phase time breakdown every generation")
+    parser.add_argument('--profile-output', default=None, help="Write per-generation timings to this .csv or .json file")
+    parser.add_argument('--cprofile', default=None, help="Run cProfile and dump its stats to this file")
+    args = parser.parse_args()
+    if args.fitness_cache and args.course_seed is None:
+        # A fresh course every generation means a (genome, course) key never comes back
+        parser.error("--fitness-cache needs a fixed course, set --course-seed")
+
+    if args.profile or args.profile_output:
+        PROFILER.enable()
+
+    # Training boxes have no display - never decode sprites
+    ASSETS.set_headless()
+
+    def report(stats):
+        print(f"Gen {stats['generation']:4d} | "
+              f"Best: {stats['max_fitness']:8.1f} | "
+              f"Avg: {stats['avg_fitness']:8.1f} | "
+              f"Record: {stats['best_ever']:8.1f}" +
+              (f" | Cached: {stats['cache_hits']}" if 'cache_hits' in stats else ""))
+        if args.profile and PROFILER.records:
+            times = PROFILER.breakdown(PROFILER.records[-1])
+            print("         " + " | ".join(f"{name}: {ms:.1f} ms" for name, ms, _ in times))
+
+    evaluator = None
+    if args.workers != 1:
+        evaluator = ParallelEvaluator(workers=args.workers or None, chunk_size=args.chunk_size)
+
+    ga = GeneticAlgorithm(population_size=args.population, crossover_method=args.crossover,
+                          selection_method=args.selection, tournament_size=args.tournament_size)
+    fitness_cache = FitnessCache(args.fitness_cache) if args.fitness_cache else None
+    trainer = HeadlessGame(seed=args.seed, vectorized=args.vectorized, ga=ga, evaluator=evaluator,
+                           fitness_cache=fitness_cache, course_seed=args.course_seed,
+                           episodes=args.episodes, aggregate=args.aggregate, quantile=args.quantile)
+    if args.resume:
+        trainer.resume(args.resume)
+
+    checkpointer = None
+    if args.checkpoint:
+        checkpointer = CheckpointWriter(args.checkpoint, every=args.checkpoint_every)
+
+    if args.cprofile:
+        PROFILER.start_cprofile()
+    recorder = ReplayRecorder(args.record) if args.record else None
+    try:
+        trainer.train(args.generations, callback=report, checkpointer=checkpointer, recorder=recorder)
+    finally:
+        if checkpointer:
+            checkpointer.close(trainer.ga, trainer.ai_brains, trainer.rng)
+        if evaluator:
+            evaluator.close()
+        if args.cprofile:
+            PROFILER.stop_cprofile(args.cprofile)
+        if args.profile_output:
+            PROFILER.export(args.profile_output)
+
+
+if __name__ == "__main__":
+    main()